@@ -1,72 +1,594 @@
 import os
+import re
 import subprocess
 import json
-import psutil
 import socket
 import platform
+import threading
+import time
 from pathlib import Path
 from fastmcp import FastMCP
 
+# Resolved repository handles, keyed by the real path of the queried directory.
+# Each entry is (git_dir, HEAD mtime) and is dropped when HEAD changes.
+_git_repos = {}
+_git_repos_lock = threading.RLock()
+
+def _is_bare_git_dir(path: str) -> bool:
+    """Check whether path itself looks like a git dir (a bare repository, or the inside of .git)"""
+    return (os.path.isfile(os.path.join(path, "HEAD"))
+            and os.path.isdir(os.path.join(path, "objects"))
+            and os.path.isdir(os.path.join(path, "refs")))
+
+def _find_git_dir(directory: str):
+    """
+    Walk up from directory to the enclosing repository, returning (git_dir, work_tree) or None.
+    
+    work_tree is None when the repository found is bare.
+    """
+    current = os.path.realpath(directory)
+    while True:
+        dot_git = os.path.join(current, ".git")
+        if os.path.isdir(dot_git):
+            return dot_git, current
+        if os.path.isfile(dot_git):
+            # Worktrees and submodules use a "gitdir: <path>" pointer file
+            try:
+                with open(dot_git, 'r', encoding='utf-8') as f:
+                    content = f.read().strip()
+            except OSError:
+                return None
+            if not content.startswith("gitdir:"):
+                return None
+            git_dir = content[len("gitdir:"):].strip()
+            return os.path.normpath(os.path.join(current, git_dir)), current
+        if _is_bare_git_dir(current):
+            return current, None
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+def _mtime_ns(path: str):
+    """Return the mtime of path in nanoseconds, or None if it is missing"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+def _git_repo(directory: str):
+    """
+    Return the git dir of the repository containing directory, or None.
+    
+    Repository discovery is done once per directory and reused until HEAD
+    changes, so the not-a-repository case is answered without spawning git.
+    Returns None when GIT_DIR is set, since git then ignores the directory's
+    own repository.
+    """
+    if "GIT_DIR" in os.environ:
+        return None
+    key = os.path.realpath(directory)
+    with _git_repos_lock:
+        entry = _git_repos.get(key)
+        if entry is not None:
+            git_dir, head_mtime = entry
+            if head_mtime is not None and _mtime_ns(os.path.join(git_dir, "HEAD")) == head_mtime:
+                return git_dir
+            del _git_repos[key]
+        
+        found = _find_git_dir(directory)
+        if found is None:
+            return None
+        git_dir = found[0]
+        _git_repos[key] = (git_dir, _mtime_ns(os.path.join(git_dir, "HEAD")))
+        return git_dir
+
+# git is still left to discover the repository from its cwd: passing an explicit
+# --git-dir/--work-tree would bypass its safe.directory ownership check.
+# --no-optional-locks is harmless outside a repository, so every command uses it.
+_GIT_ARGV = ("git", "--no-optional-locks")
+
+def _is_git_repo(directory: str) -> bool:
+    """Cheaply check whether directory is inside a Git repository, without spawning git"""
+    if not os.path.isdir(directory):
+        return False
+    # An explicit GIT_DIR can point anywhere, so leave the decision to git
+    return "GIT_DIR" in os.environ or _git_repo(directory) is not None
+
+# Fixed git subcommand argv, appended to _GIT_ARGV
+# Porcelain v2 prints paths relative to the cwd unless told otherwise; keep them repository-relative like v1
+_ARGV_STATUS = ("-c", "status.relativePaths=false", "status", "--porcelain=v2", "-b")
+_ARGV_LOG = ("log", "--oneline", "--graph", "--decorate")
+_ARGV_BRANCHES = ("for-each-ref", "--format=%(HEAD) %(refname)", "refs/heads", "refs/remotes")
+_ARGV_LOCAL_BRANCHES = ("for-each-ref", "--format=%(refname:short)", "refs/heads")
+_ARGV_DIFF = ("diff",)
+_ARGV_CONFIG_LIST = ("config", "--list", "-z")
+
+# Config keys listed under "Key Settings" by git_config
+_IMPORTANT_CONFIG_KEYS = ('user.name', 'user.email', 'core.editor', 'init.defaultbranch', 'remote.origin.url')
+# Number of non-key settings git_config lists before summarizing the rest
+_CONFIG_OTHER_SHOWN = 10
+# One anchored alternation classifies a key in a single scan instead of one per prefix
+_IMPORTANT_CONFIG_RE = re.compile('|'.join(map(re.escape, _IMPORTANT_CONFIG_KEYS)))
+
+# Collected (unformatted) tool data cached per repository state: key -> (timestamp, value)
+_GIT_CACHE_TTL = 60.0
+_git_cache = {}
+_git_cache_lock = threading.Lock()
+
+# Files under the git dir that are rewritten whenever HEAD, the index or per-worktree config change
+_GIT_STAMP_FILES = ("HEAD", "index", "config.worktree", os.path.join("logs", "HEAD"))
+# Files and directories under the common dir (shared by all worktrees) holding refs and config
+_GIT_REF_STAMP_FILES = ("config", "packed-refs", "FETCH_HEAD")
+_GIT_REF_DIRS = ("refs", "reftable")
+
+def _git_common_dir(git_dir: str) -> str:
+    """Return the directory holding refs for git_dir, which differs from it for linked worktrees"""
+    try:
+        with open(os.path.join(git_dir, "commondir"), 'r', encoding='utf-8') as f:
+            return os.path.normpath(os.path.join(git_dir, f.read().strip()))
+    except OSError:
+        return git_dir
+
+def _ref_stamps(common_dir: str) -> tuple:
+    """
+    Return mtimes tracking every ref in the repository.
+    
+    Loose refs are written to a lock file and renamed into place, so creating,
+    updating or deleting one changes the mtime of the directory it lives in;
+    every directory under refs/ is therefore stamped, not just the top one.
+    """
+    stamps = [_mtime_ns(os.path.join(common_dir, f)) for f in _GIT_REF_STAMP_FILES]
+    for ref_dir in _GIT_REF_DIRS:
+        for dirpath, _, _ in os.walk(os.path.join(common_dir, ref_dir)):
+            stamps.append((dirpath, _mtime_ns(dirpath)))
+    return tuple(stamps)
+
+def _user_config_stamps() -> tuple:
+    """Return mtimes of the global and system config files that git config --list also reads"""
+    home = os.path.expanduser("~")
+    xdg_config_home = os.environ.get("XDG_CONFIG_HOME") or os.path.join(home, ".config")
+    paths = (
+        os.environ.get("GIT_CONFIG_GLOBAL") or os.path.join(home, ".gitconfig"),
+        os.path.join(xdg_config_home, "git", "config"),
+        os.environ.get("GIT_CONFIG_SYSTEM") or "/etc/gitconfig",
+    )
+    return tuple((path, _mtime_ns(path)) for path in paths)
+
+def _git_cache_key(name: str, directory: str, *args):
+    """Build a cache key from the tool name, arguments and repository file mtimes, or None outside a repository"""
+    git_dir = _git_repo(directory)
+    if git_dir is None:
+        return None
+    stamps = tuple(_mtime_ns(os.path.join(git_dir, f)) for f in _GIT_STAMP_FILES)
+    return (name, os.path.realpath(directory), args, stamps, _ref_stamps(_git_common_dir(git_dir)))
+
+def _cached(key, ttl: float, fn):
+    """
+    Return fn()'s (ok, value) result memoized under key for ttl seconds.
+    
+    Only successful results are stored, so a timeout or transient git error
+    is retried on the next call. A None key bypasses the cache.
+    """
+    if key is None:
+        return fn()
+    
+    now = time.monotonic()
+    with _git_cache_lock:
+        hit = _git_cache.get(key)
+        if hit is not None and now - hit[0] < ttl:
+            return True, hit[1]
+    
+    ok, value = fn()
+    if ok:
+        with _git_cache_lock:
+            # Drop expired entries so superseded repository states don't accumulate
+            for stale in [k for k, (ts, _) in _git_cache.items() if now - ts >= ttl]:
+                del _git_cache[stale]
+            _git_cache[key] = (now, value)
+    return ok, value
+
+# Descriptions for the two-letter XY codes of `git status --porcelain`
+# (porcelain v2 writes '.' for an unchanged side; the parser maps it to ' ')
+_STATUS_MAP = {
+    '??': 'Untracked',
+    'A ': 'Added',
+    'M ': 'Modified',
+    ' M': 'Modified (not staged)',
+    'D ': 'Deleted',
+    ' D': 'Deleted (not staged)',
+    'R ': 'Renamed',
+    'C ': 'Copied',
+    'AM': 'Added & Modified',
+    'MM': 'Modified (partially staged)',
+    'AD': 'Added & Deleted (not staged)',
+    'RM': 'Renamed & Modified'
+}
+
+def _parse_branch_headers(headers: dict) -> str:
+    """Render porcelain v2 "# branch.*" headers the way porcelain v1 prints its "##" line"""
+    head = headers.get('branch.head', 'Unknown branch')
+    if headers.get('branch.oid') == '(initial)':
+        return f"No commits yet on {head}"
+    if head == '(detached)':
+        return "HEAD (no branch)"
+    
+    branch_info = head
+    if 'branch.upstream' in headers:
+        branch_info += f"...{headers['branch.upstream']}"
+        ahead, _, behind = headers.get('branch.ab', '+0 -0').partition(' ')
+        counts = []
+        if ahead.lstrip('+') not in ('', '0'):
+            counts.append(f"ahead {ahead.lstrip('+')}")
+        if behind.lstrip('-') not in ('', '0'):
+            counts.append(f"behind {behind.lstrip('-')}")
+        if counts:
+            branch_info += f" [{', '.join(counts)}]"
+    return branch_info
+
+def _parse_git_status(output: str):
+    """Parse `git status --porcelain=v2 -b` output into (branch_info, [(description, path), ...])"""
+    status_map = _STATUS_MAP
+    headers = {}
+    changes = []
+    for line in output.splitlines():
+        kind = line[:1]
+        if kind == '#':
+            key, _, value = line[2:].partition(' ')
+            headers[key] = value
+        elif kind == '1':
+            # 1 XY sub mH mI mW hH hI path ('.' marks an unchanged side)
+            status = line[2:4].replace('.', ' ')
+            changes.append((status_map.get(status) or f'Status: {status}', line.split(' ', 8)[8]))
+        elif kind == '2':
+            # 2 XY sub mH mI mW hH hI Xscore path<TAB>origPath
+            status = line[2:4].replace('.', ' ')
+            path, _, orig_path = line.split(' ', 9)[9].partition('\t')
+            changes.append((status_map.get(status) or f'Status: {status}', f"{orig_path} -> {path}"))
+        elif kind == 'u':
+            changes.append((f"Unmerged ({line[2:4]})", line.split(' ', 10)[10]))
+        elif kind == '?':
+            changes.append(("Untracked", line[2:]))
+    
+    return _parse_branch_headers(headers), changes
+
+def _run_git_multi(directory: str, commands: list, timeout: float = 15) -> list:
+    """
+    Run several git subcommands against directory concurrently.
+    
+    Every process is spawned up front and then drained in order, so the total
+    wait is roughly that of the slowest command rather than the sum of all of
+    them. Returns an (ok, text) pair per command, as _run_git does.
+    """
+    if not _is_git_repo(directory):
+        return [(False, f"Directory '{directory}' is not a Git repository")] * len(commands)
+    
+    deadline = time.monotonic() + timeout
+    procs = []
+    try:
+        for command in commands:
+            procs.append(subprocess.Popen(
+                _GIT_ARGV + command,
+                cwd=directory,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            ))
+        
+        results = []
+        for proc in procs:
+            stdout, stderr = proc.communicate(timeout=max(0, deadline - time.monotonic()))
+            results.append(_git_output(directory, proc.returncode, stdout, stderr))
+        return results
+    except subprocess.TimeoutExpired:
+        return [(False, "Git command timed out")] * len(commands)
+    except FileNotFoundError:
+        return [(False, "Git is not installed or not in PATH")] * len(commands)
+    finally:
+        # Don't leave stragglers behind after a timeout or failed spawn
+        for proc in procs:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+
+# Upper bound on the git log/diff output buffered for a single tool call
+_GIT_OUTPUT_LIMIT = 4 * 1024 * 1024
+
+def _run_capped(cmd, cwd: str, timeout: float, limit: int = _GIT_OUTPUT_LIMIT):
+    """
+    Run cmd, reading at most limit bytes of its stdout.
+    
+    Output is consumed incrementally and the process is killed once the cap
+    is reached, so a huge diff is never buffered in full. stderr is drained
+    on a separate thread so git can't stall on a full stderr pipe (one
+    line-ending warning per file adds up quickly). Returns
+    (returncode, stdout bytes, stderr bytes, truncated) and raises
+    subprocess.TimeoutExpired like subprocess.run.
+    """
+    with subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as proc:
+        timed_out = threading.Event()
+        def on_timeout():
+            timed_out.set()
+            proc.kill()
+        timer = threading.Timer(timeout, on_timeout)
+        timer.start()
+        stderr_chunks = []
+        stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True)
+        stderr_reader.start()
+        try:
+            chunks = []
+            size = 0
+            truncated = False
+            while True:
+                chunk = proc.stdout.read(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= limit:
+                    truncated = True
+                    proc.kill()
+                    break
+            returncode = proc.wait()
+            stderr_reader.join()
+            stderr = b''.join(stderr_chunks)
+        finally:
+            timer.cancel()
+    
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    
+    stdout = b''.join(chunks)
+    if truncated:
+        # Cut back to the last complete line within the cap
+        stdout = stdout[:limit]
+        stdout = stdout[:stdout.rfind(b'\n') + 1] or stdout
+        returncode = 0
+    return returncode, stdout, stderr, truncated
+
+def _git_output(directory: str, returncode: int, stdout: bytes, stderr: bytes, truncated: bool = False):
+    """Turn a finished git process into (ok, text): decoded stdout on success, an error message otherwise"""
+    if returncode != 0:
+        stderr = stderr.decode('utf-8', errors='replace')
+        if "not a git repository" in stderr.lower():
+            return False, f"Directory '{directory}' is not a Git repository"
+        return False, f"Git error: {stderr}"
+    
+    # Decode once at the end; git emits UTF-8 regardless of the console code page
+    output = stdout.decode('utf-8', errors='replace')
+    if truncated:
+        output += f"\n... (output truncated at {_GIT_OUTPUT_LIMIT // (1024 * 1024)} MB)"
+    return True, output
+
+def _run_git(directory: str, args: tuple, timeout: float = 10, capped: bool = False, require_repo: bool = True):
+    """
+    Run a git subcommand for directory and return (ok, text).
+    
+    On success text is the decoded stdout; on failure it is a message ready to
+    be returned from a tool. This is the one place handling the
+    not-a-repository fast path, timeouts and a missing git executable.
+    capped reads stdout through _run_capped for potentially huge output.
+    """
+    if require_repo and not _is_git_repo(directory):
+        return False, f"Directory '{directory}' is not a Git repository"
+    
+    cmd = _GIT_ARGV + args
+    try:
+        if capped:
+            return _git_output(directory, *_run_capped(cmd, cwd=directory, timeout=timeout))
+        result = subprocess.run(cmd, cwd=directory, capture_output=True, timeout=timeout)
+        return _git_output(directory, result.returncode, result.stdout, result.stderr)
+    except subprocess.TimeoutExpired:
+        return False, "Git command timed out"
+    except FileNotFoundError:
+        return False, "Git is not installed or not in PATH"
+
+def _render_changes(changes: list) -> str:
+    """Format (description, path) pairs from _parse_git_status, one indented line each"""
+    return "\n".join([f"  {description}: {path}" for description, path in changes])
+
+# Each git tool is split into a collector returning (ok, data) - data being an
+# error message when ok is False - and a renderer turning data into tool text.
+
+def _status_argv(show_untracked: bool = True, detect_renames: bool = False) -> tuple:
+    """Build the git status argv shared by git_status and git_overview"""
+    args = _ARGV_STATUS
+    if not show_untracked:
+        args += ("-uno",)
+    if not detect_renames:
+        args += ("--no-renames",)
+    return args
+
+def _collect_git_status(directory: str, show_untracked: bool = True, detect_renames: bool = False):
+    """Run git status and return (ok, {"branch": str, "changes": [(description, path), ...]})"""
+    ok, output = _run_git(directory, _status_argv(show_untracked, detect_renames))
+    if not ok:
+        return False, output
+    branch_info, changes = _parse_git_status(output)
+    return True, {"branch": branch_info, "changes": changes}
+
+def _render_git_status(directory: str, data: dict) -> str:
+    """Format _collect_git_status data as git_status output"""
+    parts = [f"Git Status for '{directory}':\n", f"Branch: {data['branch']}\n\n"]
+    if data["changes"]:
+        parts.append("Changes:\n")
+        parts.append(_render_changes(data["changes"]))
+    else:
+        parts.append("No changes detected")
+    return ''.join(parts)
+
+def _collect_git_log(directory: str, limit: int):
+    """Return (ok, raw `git log --graph` text), cached per repository state"""
+    return _cached(
+        _git_cache_key("git_log", directory, limit),
+        _GIT_CACHE_TTL,
+        lambda: _run_git(directory, _ARGV_LOG + (f"--max-count={limit}",), timeout=15, capped=True)
+    )
+
+def _render_git_log(directory: str, limit: int, output: str) -> str:
+    """Format raw log text as git_log output"""
+    if not output.strip():
+        return f"No commits found in repository '{directory}'"
+    return f"Git Log for '{directory}' (last {limit} commits):\n\n{output}"
+
+def _load_git_branches(directory: str):
+    """Run for-each-ref and split the refs into local and remote branch names"""
+    # One for-each-ref call lists both local and remote branches
+    ok, output = _run_git(directory, _ARGV_BRANCHES)
+    if not ok:
+        return False, output
+    
+    data = {"local": [], "current": None, "remote": []}
+    for line in output.splitlines():
+        current, refname = line[:1], line[2:]
+        if refname.startswith("refs/heads/"):
+            name = refname[len("refs/heads/"):]
+            data["local"].append(name)
+            if current == '*':
+                data["current"] = name
+        elif refname.startswith("refs/remotes/") and not refname.endswith("/HEAD"):
+            data["remote"].append(refname[len("refs/remotes/"):])
+    return True, data
+
+def _collect_git_branches(directory: str):
+    """Return (ok, {"local": [names], "current": name or None, "remote": [names]}), cached per repository state"""
+    return _cached(_git_cache_key("git_branches", directory), _GIT_CACHE_TTL, lambda: _load_git_branches(directory))
+
+def _render_git_branches(directory: str, data: dict) -> str:
+    """Format _collect_git_branches data as git_branches output"""
+    parts = [f"Git Branches for '{directory}':\n\n"]
+    
+    if data["local"]:
+        parts.append("Local branches:\n")
+        parts.extend(
+            f"  * {name} (current)\n" if name == data["current"] else f"  {name}\n"
+            for name in data["local"]
+        )
+    
+    if data["remote"]:
+        parts.append("\nRemote branches:\n")
+        parts.extend(f"  {name}\n" for name in data["remote"])
+    
+    return ''.join(parts)
+
+def _load_git_config(directory: str):
+    """Run git config --list and group the entries into important and other settings"""
+    # Outside a repository git still reports the global configuration
+    ok, output = _run_git(directory, _ARGV_CONFIG_LIST, require_repo=False)
+    if not ok:
+        return False, output
+    
+    # -z emits NUL-terminated "key\nvalue" records. Only the first few other
+    # settings are displayed, so the rest are just counted.
+    important = []
+    other_shown = []
+    other_count = 0
+    for record in output.split('\0'):
+        key, sep, value = record.partition('\n')
+        if sep:
+            if _IMPORTANT_CONFIG_RE.match(key):
+                important.append((key, value))
+            else:
+                other_count += 1
+                if other_count <= _CONFIG_OTHER_SHOWN:
+                    other_shown.append((key, value))
+    return True, {"important": important, "other": other_shown, "other_count": other_count}
+
+def _collect_git_config(directory: str):
+    """Return (ok, {"important": [(key, value)], "other": [first (key, value)s], "other_count": int}), cached per repository state"""
+    # Unlike the other tools, the listing includes settings from outside the repository
+    key = _git_cache_key("git_config", directory, _user_config_stamps())
+    return _cached(key, _GIT_CACHE_TTL, lambda: _load_git_config(directory))
+
+def _render_git_config(directory: str, data: dict) -> str:
+    """Format _collect_git_config data as git_config output"""
+    important_configs = data["important"]
+    other_configs = data["other"]
+    other_count = data["other_count"]
+    if not important_configs and not other_count:
+        return "No Git configuration found"
+    
+    parts = [f"Git Configuration for '{directory}':\n\n"]
+    
+    if important_configs:
+        parts.extend(("Key Settings:\n", "\n".join([f"  {key} = {value}" for key, value in important_configs]), "\n\n"))
+    
+    if other_count:
+        parts.extend((
+            f"Other Settings ({other_count} total):\n",
+            "\n".join([f"  {key} = {value}" for key, value in other_configs])
+        ))
+        if other_count > len(other_configs):
+            parts.append(f"\n  ... and {other_count - len(other_configs)} more")
+    
+    return ''.join(parts)
+
+# Last TCP socket table scan shared by the dev-server tools: (timestamp, connections)
+_net_cache = None
+_net_cache_lock = threading.Lock()
+
+def _get_net_connections(ttl: float = 1.0) -> list:
+    """Return psutil.net_connections(kind='tcp'), reusing a scan taken within the last ttl seconds"""
+    import psutil
+    global _net_cache
+    with _net_cache_lock:
+        now = time.monotonic()
+        if _net_cache is not None and now - _net_cache[0] < ttl:
+            return _net_cache[1]
+        connections = psutil.net_connections(kind='tcp')
+        _net_cache = (now, connections)
+        return connections
+
+# Common development ports and what usually listens on them
+_COMMON_PORT_DESCS = {
+    3000: "React/Node.js dev server",
+    3001: "Alternative React dev server",
+    4200: "Angular dev server",
+    5000: "Flask/Express dev server",
+    5173: "Vite dev server",
+    8000: "Django/Python dev server",
+    8080: "Tomcat/Alternative web server",
+    8888: "Jupyter Notebook",
+    9000: "Various dev tools"
+}
+_DEV_PORTS = frozenset(_COMMON_PORT_DESCS)
+
+# Port state labels used by check_common_dev_ports
+_OPEN = "[OPEN]"
+_CLOSED = "[CLOSED]"
+
+def _join_capped(parts, limit: int = 100) -> str:
+    """Join parts with spaces, truncating to limit characters without building the full string"""
+    pieces = []
+    length = -1  # No separator before the first part
+    for part in parts:
+        pieces.append(part)
+        length += len(part) + 1
+        if length > limit:
+            return ' '.join(pieces)[:limit - 3] + "..."
+    return ' '.join(pieces)
+
 def register_development_tools(mcp: FastMCP):
     """Register all development related tools"""
     
     # Git Tools
     @mcp.tool
-    def git_status(directory: str = ".") -> str:
-        """Check Git repository status"""
+    def git_status(directory: str = ".", show_untracked: bool = True, detect_renames: bool = False) -> str:
+        """
+        Check Git repository status.
+        
+        Args:
+            directory: Repository directory to inspect (default: current directory)
+            show_untracked: Whether to list untracked files. Scanning for them is
+                usually the slowest part of status on large working trees.
+            detect_renames: Whether to pair deletions and additions into renames,
+                which is costly when many files changed
+        
+        Returns:
+            Branch information and the list of changed files
+        """
         try:
-            result = subprocess.run(
-                ["git", "status", "--porcelain", "-b"],
-                cwd=directory,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if result.returncode != 0:
-                if "not a git repository" in result.stderr.lower():
-                    return f"Directory '{directory}' is not a Git repository"
-                return f"Git error: {result.stderr}"
-            
-            lines = result.stdout.strip().split('\n')
-            if not lines or lines == ['']:
-                return f"Git repository in '{directory}' is clean (no changes)"
-            
-            # Parse the output
-            branch_line = lines[0] if lines[0].startswith('##') else "## Unknown branch"
-            branch_info = branch_line[3:]  # Remove '## '
-            
-            changes = []
-            for line in lines[1:]:
-                if line.strip():
-                    status = line[:2]
-                    filename = line[3:]
-                    status_desc = {
-                        '??': 'Untracked',
-                        'A ': 'Added',
-                        'M ': 'Modified',
-                        ' M': 'Modified (not staged)',
-                        'D ': 'Deleted',
-                        ' D': 'Deleted (not staged)',
-                        'R ': 'Renamed',
-                        'C ': 'Copied',
-                        'AM': 'Added & Modified'
-                    }.get(status, f'Status: {status}')
-                    changes.append(f"  {status_desc}: {filename}")
-            
-            result_text = f"Git Status for '{directory}':\n"
-            result_text += f"Branch: {branch_info}\n\n"
-            if changes:
-                result_text += "Changes:\n" + "\n".join(changes)
-            else:
-                result_text += "No changes detected"
-            
-            return result_text
-            
-        except subprocess.TimeoutExpired:
-            return "Git command timed out"
-        except FileNotFoundError:
-            return "Git is not installed or not in PATH"
+            ok, data = _collect_git_status(directory, show_untracked, detect_renames)
+            return _render_git_status(directory, data) if ok else data
         except Exception as e:
             return f"Error checking Git status: {str(e)}"
 
@@ -74,28 +596,8 @@ def register_development_tools(mcp: FastMCP):
     def git_log(directory: str = ".", limit: int = 5) -> str:
         """Show Git commit history"""
         try:
-            result = subprocess.run(
-                ["git", "log", f"--max-count={limit}", "--oneline", "--graph", "--decorate"],
-                cwd=directory,
-                capture_output=True,
-                text=True,
-                timeout=15
-            )
-            
-            if result.returncode != 0:
-                if "not a git repository" in result.stderr.lower():
-                    return f"Directory '{directory}' is not a Git repository"
-                return f"Git error: {result.stderr}"
-            
-            if not result.stdout.strip():
-                return f"No commits found in repository '{directory}'"
-            
-            return f"Git Log for '{directory}' (last {limit} commits):\n\n{result.stdout}"
-            
-        except subprocess.TimeoutExpired:
-            return "Git log command timed out"
-        except FileNotFoundError:
-            return "Git is not installed or not in PATH"
+            ok, output = _collect_git_log(directory, limit)
+            return _render_git_log(directory, limit, output) if ok else output
         except Exception as e:
             return f"Error getting Git log: {str(e)}"
 
@@ -103,55 +605,8 @@ def register_development_tools(mcp: FastMCP):
     def git_branches(directory: str = ".") -> str:
         """List Git branches"""
         try:
-            # Get local branches
-            local_result = subprocess.run(
-                ["git", "branch"],
-                cwd=directory,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if local_result.returncode != 0:
-                if "not a git repository" in local_result.stderr.lower():
-                    return f"Directory '{directory}' is not a Git repository"
-                return f"Git error: {local_result.stderr}"
-            
-            # Get remote branches
-            remote_result = subprocess.run(
-                ["git", "branch", "-r"],
-                cwd=directory,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            result_text = f"Git Branches for '{directory}':\n\n"
-            
-            # Parse local branches
-            if local_result.stdout.strip():
-                result_text += "Local branches:\n"
-                for line in local_result.stdout.strip().split('\n'):
-                    line = line.strip()
-                    if line.startswith('*'):
-                        result_text += f"  {line} (current)\n"
-                    else:
-                        result_text += f"  {line}\n"
-            
-            # Parse remote branches
-            if remote_result.returncode == 0 and remote_result.stdout.strip():
-                result_text += "\nRemote branches:\n"
-                for line in remote_result.stdout.strip().split('\n'):
-                    line = line.strip()
-                    if line and not line.startswith('origin/HEAD'):
-                        result_text += f"  {line}\n"
-            
-            return result_text
-            
-        except subprocess.TimeoutExpired:
-            return "Git branches command timed out"
-        except FileNotFoundError:
-            return "Git is not installed or not in PATH"
+            ok, data = _collect_git_branches(directory)
+            return _render_git_branches(directory, data) if ok else data
         except Exception as e:
             return f"Error getting Git branches: {str(e)}"
 
@@ -159,34 +614,16 @@ def register_development_tools(mcp: FastMCP):
     def git_diff(directory: str = ".", file_path: str = "") -> str:
         """Show Git differences"""
         try:
-            cmd = ["git", "diff"]
-            if file_path:
-                cmd.append(file_path)
-            
-            result = subprocess.run(
-                cmd,
-                cwd=directory,
-                capture_output=True,
-                text=True,
-                timeout=15
-            )
-            
-            if result.returncode != 0:
-                if "not a git repository" in result.stderr.lower():
-                    return f"Directory '{directory}' is not a Git repository"
-                return f"Git error: {result.stderr}"
-            
-            if not result.stdout.strip():
-                target = f" for file '{file_path}'" if file_path else ""
-                return f"No differences found{target} in repository '{directory}'"
+            args = _ARGV_DIFF + (file_path,) if file_path else _ARGV_DIFF
+            ok, output = _run_git(directory, args, timeout=15, capped=True)
+            if not ok:
+                return output
             
             target = f" for file '{file_path}'" if file_path else ""
-            return f"Git Diff{target} for '{directory}':\n\n{result.stdout}"
+            if not output.strip():
+                return f"No differences found{target} in repository '{directory}'"
             
-        except subprocess.TimeoutExpired:
-            return "Git diff command timed out"
-        except FileNotFoundError:
-            return "Git is not installed or not in PATH"
+            return f"Git Diff{target} for '{directory}':\n\n{output}"
         except Exception as e:
             return f"Error getting Git diff: {str(e)}"
 
@@ -194,81 +631,86 @@ def register_development_tools(mcp: FastMCP):
     def git_config(directory: str = ".") -> str:
         """Show Git configuration"""
         try:
-            result = subprocess.run(
-                ["git", "config", "--list"],
-                cwd=directory,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if result.returncode != 0:
-                return f"Git config error: {result.stderr}"
-            
-            if not result.stdout.strip():
-                return "No Git configuration found"
-            
-            # Parse and organize config
-            config_lines = result.stdout.strip().split('\n')
-            important_configs = []
-            other_configs = []
+            ok, data = _collect_git_config(directory)
+            return _render_git_config(directory, data) if ok else data
+        except Exception as e:
+            return f"Error getting Git config: {str(e)}"
+
+    @mcp.tool
+    def git_overview(directory: str = ".", limit: int = 5) -> str:
+        """Show Git branch, working tree changes, local branches and recent commits in one call"""
+        try:
+            status, log, branches = _run_git_multi(directory, [
+                _status_argv(),
+                _ARGV_LOG + (f"--max-count={limit}",),
+                _ARGV_LOCAL_BRANCHES,
+            ])
             
-            important_keys = ['user.name', 'user.email', 'core.editor', 'init.defaultbranch', 'remote.origin.url']
+            if not status[0]:
+                return status[1]
             
-            for line in config_lines:
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    if any(important in key for important in important_keys):
-                        important_configs.append(f"  {key} = {value}")
-                    else:
-                        other_configs.append(f"  {key} = {value}")
+            branch_info, changes = _parse_git_status(status[1])
             
-            result_text = f"Git Configuration for '{directory}':\n\n"
+            parts = [f"Git Overview for '{directory}':\n", f"Branch: {branch_info}\n\n"]
             
-            if important_configs:
-                result_text += "Key Settings:\n" + "\n".join(important_configs) + "\n\n"
+            if changes:
+                parts.extend((f"Changes ({len(changes)}):\n", _render_changes(changes), "\n\n"))
+            else:
+                parts.append("Working tree clean\n\n")
             
-            if other_configs:
-                result_text += f"Other Settings ({len(other_configs)} total):\n" + "\n".join(other_configs[:10])
-                if len(other_configs) > 10:
-                    result_text += f"\n  ... and {len(other_configs) - 10} more"
+            if branches[0] and branches[1].strip():
+                parts.extend(("Local branches: ", ", ".join(branches[1].split()), "\n\n"))
             
-            return result_text
+            if log[0] and log[1].strip():
+                parts.append(f"Recent commits (last {limit}):\n{log[1]}")
+            else:
+                parts.append("No commits yet")
             
-        except subprocess.TimeoutExpired:
-            return "Git config command timed out"
-        except FileNotFoundError:
-            return "Git is not installed or not in PATH"
+            return ''.join(parts)
         except Exception as e:
-            return f"Error getting Git config: {str(e)}"
+            return f"Error getting Git overview: {str(e)}"
 
     # Port Management Tools
     @mcp.tool
     def kill_process_on_port(port: int) -> str:
         """Kill process running on a specific port"""
+        import psutil
         try:
-            killed_processes = []
-            
-            # Find processes using the port
-            for conn in psutil.net_connections(kind='inet'):
-                if conn.laddr and conn.laddr.port == port:
-                    if conn.pid:
-                        try:
-                            process = psutil.Process(conn.pid)
-                            process_info = f"PID {conn.pid} ({process.name()})"
-                            process.terminate()
-                            
-                            # Wait a bit for graceful termination
-                            try:
-                                process.wait(timeout=3)
-                                killed_processes.append(f"Terminated: {process_info}")
-                            except psutil.TimeoutExpired:
-                                # Force kill if it doesn't terminate gracefully
-                                process.kill()
-                                killed_processes.append(f"Force killed: {process_info}")
-                                
-                        except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
-                            killed_processes.append(f"Could not kill PID {conn.pid}: {str(e)}")
+            # Find processes using the port; a server bound to both IPv4 and
+            # IPv6 shows up once per socket, so collect unique PIDs first
+            pids = []
+            for conn in psutil.net_connections(kind='tcp'):
+                if conn.laddr and conn.laddr.port == port and conn.pid and conn.pid not in pids:
+                    pids.append(conn.pid)
+            
+            # Signal every process first so they all shut down concurrently
+            results = {}
+            labels = {}
+            terminating = []
+            for pid in pids:
+                try:
+                    process = psutil.Process(pid)
+                    labels[pid] = f"PID {pid} ({process.name()})"
+                    process.terminate()
+                    terminating.append(process)
+                except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
+                    results[pid] = f"Could not kill PID {pid}: {str(e)}"
+            
+            # Wait a bit for graceful termination, sharing one deadline
+            gone, alive = psutil.wait_procs(terminating, timeout=3)
+            for process in gone:
+                results[process.pid] = f"Terminated: {labels[process.pid]}"
+            for process in alive:
+                # Force kill if it doesn't terminate gracefully
+                try:
+                    process.kill()
+                    results[process.pid] = f"Force killed: {labels[process.pid]}"
+                except psutil.NoSuchProcess:
+                    results[process.pid] = f"Terminated: {labels[process.pid]}"
+                except psutil.AccessDenied as e:
+                    results[process.pid] = f"Could not kill PID {process.pid}: {str(e)}"
+            
+            killed_processes = [results[pid] for pid in pids]
             
             if not killed_processes:
                 return f"No processes found running on port {port}"
@@ -281,71 +723,70 @@ def register_development_tools(mcp: FastMCP):
     @mcp.tool
     def find_running_dev_servers(check_common_ports: bool = True) -> str:
         """Find running development servers"""
+        import psutil
         try:
-            # Common development ports
-            dev_ports = [3000, 3001, 4200, 5000, 5173, 8000, 8080, 8888, 9000] if check_common_ports else []
-            
-            running_servers = []
-            all_connections = psutil.net_connections(kind='inet')
+            all_connections = _get_net_connections()
             
             # Group by port for better organization
             port_processes = {}
+            # The same PID often owns several listening sockets (IPv4 + IPv6)
+            pid_info_cache = {}
             
             for conn in all_connections:
                 if conn.laddr and conn.status == 'LISTEN':
                     port = conn.laddr.port
                     
                     # Check all listening ports or just common dev ports
-                    if not check_common_ports or port in dev_ports:
+                    if not check_common_ports or port in _DEV_PORTS:
                         if port not in port_processes:
                             port_processes[port] = []
                         
                         if conn.pid:
-                            try:
-                                process = psutil.Process(conn.pid)
-                                process_name = process.name()
-                                
-                                # Try to get more details for common dev servers
+                            if conn.pid not in pid_info_cache:
                                 try:
-                                    cmdline = ' '.join(process.cmdline())
-                                    # Truncate very long command lines
-                                    if len(cmdline) > 100:
-                                        cmdline = cmdline[:97] + "..."
-                                except:
-                                    cmdline = process_name
-                                
-                                port_processes[port].append({
-                                    'pid': conn.pid,
-                                    'name': process_name,
-                                    'cmdline': cmdline,
-                                    'address': conn.laddr.ip
-                                })
-                            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                                port_processes[port].append({
-                                    'pid': conn.pid,
-                                    'name': 'Unknown',
-                                    'cmdline': 'Access denied',
-                                    'address': conn.laddr.ip
-                                })
+                                    process = psutil.Process(conn.pid)
+                                    with process.oneshot():
+                                        process_name = process.name()
+                                        
+                                        # Try to get more details for common dev servers
+                                        try:
+                                            # Truncate very long command lines
+                                            cmdline = _join_capped(process.cmdline())
+                                        except (psutil.NoSuchProcess, psutil.AccessDenied):
+                                            cmdline = process_name
+                                    
+                                    pid_info_cache[conn.pid] = (process_name, cmdline)
+                                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                                    pid_info_cache[conn.pid] = ('Unknown', 'Access denied')
+                            
+                            process_name, cmdline = pid_info_cache[conn.pid]
+                            port_processes[port].append({
+                                'pid': conn.pid,
+                                'name': process_name,
+                                'cmdline': cmdline,
+                                'address': conn.laddr.ip
+                            })
             
             if not port_processes:
                 port_type = "common development" if check_common_ports else "any"
                 return f"No processes found listening on {port_type} ports"
             
-            result = "Running Development Servers:\n\n"
+            parts = ["Running Development Servers:\n\n"]
             
             for port in sorted(port_processes.keys()):
                 processes = port_processes[port]
-                result += f"Port {port}:\n"
+                parts.append(f"Port {port}:\n")
                 
                 for proc in processes:
-                    result += f"  PID {proc['pid']} - {proc['name']}\n"
-                    result += f"    Address: {proc['address']}:{port}\n"
+                    parts.extend((
+                        f"  PID {proc['pid']} - {proc['name']}\n",
+                        f"    Address: {proc['address']}:{port}\n"
+                    ))
                     if proc['cmdline'] != proc['name']:
-                        result += f"    Command: {proc['cmdline']}\n"
-                result += "\n"
+                        parts.append(f"    Command: {proc['cmdline']}\n")
+                parts.append("\n")
             
-            return result
+            return ''.join(parts)
             
         except Exception as e:
             return f"Error finding running development servers: {str(e)}"
@@ -353,56 +794,45 @@ def register_development_tools(mcp: FastMCP):
     @mcp.tool
     def check_common_dev_ports() -> str:
         """Check status of common development ports"""
+        import psutil
         try:
-            common_ports = {
-                3000: "React/Node.js dev server",
-                3001: "Alternative React dev server", 
-                4200: "Angular dev server",
-                5000: "Flask/Express dev server",
-                5173: "Vite dev server",
-                8000: "Django/Python dev server",
-                8080: "Tomcat/Alternative web server",
-                8888: "Jupyter Notebook",
-                9000: "Various dev tools"
-            }
+            common_ports = _COMMON_PORT_DESCS
             
-            result = "Common Development Ports Status:\n\n"
+            parts = ["Common Development Ports Status:\n\n"]
             
             active_connections = {}
-            for conn in psutil.net_connections(kind='inet'):
-                if conn.laddr and conn.status == 'LISTEN':
+            for conn in _get_net_connections():
+                # Cheap int membership test before the status string compare
+                if conn.laddr and conn.laddr.port in common_ports and conn.status == 'LISTEN':
                     port = conn.laddr.port
-                    if port in common_ports:
-                        if port not in active_connections:
-                            active_connections[port] = []
-                        
-                        process_info = "Unknown process"
-                        if conn.pid:
-                            try:
-                                process = psutil.Process(conn.pid)
-                                process_info = f"{process.name()} (PID {conn.pid})"
-                            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                                process_info = f"PID {conn.pid} (access denied)"
-                        
-                        active_connections[port].append({
-                            'address': conn.laddr.ip,
-                            'process': process_info
-                        })
+                    if port not in active_connections:
+                        active_connections[port] = []
+                    
+                    process_info = "Unknown process"
+                    if conn.pid:
+                        try:
+                            process = psutil.Process(conn.pid)
+                            process_info = f"{process.name()} (PID {conn.pid})"
+                        except (psutil.NoSuchProcess, psutil.AccessDenied):
+                            process_info = f"PID {conn.pid} (access denied)"
+                    
+                    active_connections[port].append({
+                        'address': conn.laddr.ip,
+                        'process': process_info
+                    })
             
-            for port in sorted(common_ports.keys()):
+            for port in sorted(common_ports):
                 description = common_ports[port]
-                status = "🔴 CLOSED"
-                details = ""
-                
                 if port in active_connections:
-                    status = "🟢 OPEN"
-                    details = "\n"
-                    for conn in active_connections[port]:
-                        details += f"    • {conn['address']}:{port} - {conn['process']}\n"
-                
-                result += f"Port {port:4d} ({description}): {status}{details}\n"
-            
-            return result
+                    details = "".join([
+                        f"    - {conn['address']}:{port} - {conn['process']}\n"
+                        for conn in active_connections[port]
+                    ])
+                    parts.append(f"Port {port:4d} ({description}): {_OPEN}\n{details}\n")
+                else:
+                    parts.append(f"Port {port:4d} ({description}): {_CLOSED}\n")
+            
+            return ''.join(parts)
             
         except Exception as e:
             return f"Error checking development ports: {str(e)}"
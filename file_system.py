@@ -1,11 +1,15 @@
 import os
 import json
+import codecs
 import shutil
 import stat
-import glob
+import re
+import fnmatch
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from datetime import datetime
 from fastmcp import FastMCP
+from utils import format_size, dumps_indented, format_timestamp, isoformat_timestamp
 
 # Helper function to safely resolve paths
 def safe_path(path: str, base_path: str = None) -> Path:
@@ -20,374 +24,545 @@ def safe_path(path: str, base_path: str = None) -> Path:
     else:
         return Path(path).resolve()
 
-def _format_size(size_bytes: int) -> str:
-    """Convert bytes to human-readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} PB"
+# read_file returns only this much of larger files
+_READ_FILE_LIMIT = 10 * 1024 * 1024
 
-def register_file_system_tools(mcp: FastMCP):
-    """Register all file system related tools"""
+# Parent directories already created or confirmed, in insertion order for FIFO eviction
+_KNOWN_DIRS_MAX = 4096
+_known_dirs = {}
+_known_dirs_lock = threading.Lock()
+
+def _remember_dir(directory: str):
+    """Record directory as existing, evicting the oldest entry when the cache is full"""
+    with _known_dirs_lock:
+        _known_dirs[directory] = None
+        if len(_known_dirs) > _KNOWN_DIRS_MAX:
+            del _known_dirs[next(iter(_known_dirs))]
+
+def _with_parent_dir(path: Path, action):
+    """
+    Make sure path's parent directory exists, then return action().
     
-    @mcp.tool
-    def read_file(file_path: str, encoding: str = "utf-8") -> str:
-        """
-        Read the contents of a file.
-        
-        Args:
-            file_path: Path to the file to read
-            encoding: Text encoding to use (default: utf-8)
-        
-        Returns:
-            The contents of the file as a string
-        """
+    Recently seen parents skip the mkdir. If one was removed in the meantime,
+    the resulting FileNotFoundError recreates it and retries once.
+    """
+    parent = str(path.parent)
+    with _known_dirs_lock:
+        known = parent in _known_dirs
+    
+    if not known:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _remember_dir(parent)
+        return action()
+    
+    try:
+        return action()
+    except FileNotFoundError:
+        with _known_dirs_lock:
+            _known_dirs.pop(parent, None)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _remember_dir(parent)
+        return action()
+
+def _iter_matching_files(directory: str, regex: re.Pattern, recursive: bool = True,
+                         follow_symlinks: bool = False, ancestors: frozenset = frozenset()):
+    """
+    Yield paths of files under directory whose name matches regex, in a single scandir walk.
+    
+    Directory symlinks are only descended into with follow_symlinks, as glob's
+    '**' does; a link back to a directory on the current path (ancestors holds
+    their (st_dev, st_ino)) is skipped rather than walked forever.
+    """
+    pending = [(directory, ancestors)]
+    while pending:
+        current, ancestors = pending.pop()
+        if follow_symlinks:
+            try:
+                st = os.stat(current)
+            except OSError:
+                continue
+            dir_id = (st.st_dev, st.st_ino)
+            if dir_id in ancestors:
+                continue
+            ancestors = ancestors | {dir_id}
         try:
-            path = safe_path(file_path)
-            if not path.exists():
-                return f"Error: File '{file_path}' does not exist"
-            if not path.is_file():
-                return f"Error: '{file_path}' is not a file"
-            
-            with open(path, 'r', encoding=encoding) as f:
-                return f.read()
-        except Exception as e:
-            return f"Error reading file: {str(e)}"
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            # Like os.walk, don't descend into directory symlinks unless asked to
+                            if recursive and (follow_symlinks or not entry.is_symlink()):
+                                pending.append((entry.path, ancestors))
+                        elif regex.match(entry.name):
+                            yield entry.path
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+
+def _search_tree(directory: str, regex: re.Pattern, follow_symlinks: bool = False) -> list:
+    """Recursively collect matching files, walking each top-level subdirectory in its own thread"""
+    matches = []
+    subdirs = []
+    ancestors = frozenset()
+    if follow_symlinks:
+        base_st = os.stat(directory)
+        ancestors = frozenset({(base_st.st_dev, base_st.st_ino)})
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    if follow_symlinks or not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif regex.match(entry.name):
+                    matches.append(entry.path)
+            except OSError:
+                pass
+    
+    if not subdirs:
+        return matches
+    
+    # The walks are dominated by directory reads, which release the GIL
+    workers = min(32, (os.cpu_count() or 1) * 2, len(subdirs))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(list, _iter_matching_files(d, regex, follow_symlinks=follow_symlinks, ancestors=ancestors))
+            for d in subdirs
+        ]
+        for future in as_completed(futures):
+            matches.extend(future.result())
+    return matches
+
+# Threads used to overlap file unlinks when deleting a directory tree
+_RMTREE_WORKERS = 8
+
+def _is_junction(st: os.stat_result) -> bool:
+    """
+    Return True if st describes a directory junction (Windows only).
+    
+    Like shutil.rmtree, only mount-point reparse points count: OneDrive and
+    other cloud-file placeholder folders are reparse points too, but they are
+    real directories whose contents have to be deleted first.
+    """
+    return bool(st.st_file_attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT
+                and st.st_reparse_tag == stat.IO_REPARSE_TAG_MOUNT_POINT)
+
+def _rmtree_dir(directory: str, executor: ThreadPoolExecutor):
+    """Delete one directory level: unlink its files on the pool, recurse into subdirectories, then rmdir"""
+    files = []
+    subdirs = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                # Files and symlinks; links are removed, never followed
+                files.append(entry.path)
+            elif os.name == 'nt' and _is_junction(entry.stat(follow_symlinks=False)):
+                # Junctions report as directories but must not be descended into
+                os.rmdir(entry.path)
+            else:
+                subdirs.append(entry.path)
+    
+    # Draining the map re-raises the first failed unlink
+    for _ in executor.map(os.unlink, files):
+        pass
+    for subdir in subdirs:
+        _rmtree_dir(subdir, executor)
+    os.rmdir(directory)
 
-    @mcp.tool
-    def write_file(file_path: str, content: str, encoding: str = "utf-8", create_dirs: bool = True) -> str:
-        """
-        Write content to a file.
+def _rmtree_parallel(directory: str):
+    """Delete a directory tree like shutil.rmtree, overlapping the per-file unlinks on a thread pool"""
+    with ThreadPoolExecutor(max_workers=_RMTREE_WORKERS) as executor:
+        _rmtree_dir(directory, executor)
+
+def read_file(file_path: str, encoding: str = "utf-8") -> str:
+    """
+    Read the contents of a file.
+    
+    Args:
+        file_path: Path to the file to read
+        encoding: Text encoding to use (default: utf-8)
+    
+    Returns:
+        The contents of the file as a string (truncated beyond 10 MB)
+    """
+    try:
+        path = safe_path(file_path)
+        if not path.exists():
+            return f"Error: File '{file_path}' does not exist"
+        if not path.is_file():
+            return f"Error: '{file_path}' is not a file"
         
-        Args:
-            file_path: Path to the file to write
-            content: Content to write to the file
-            encoding: Text encoding to use (default: utf-8)
-            create_dirs: Whether to create parent directories if they don't exist
+        size = path.stat().st_size
+        if size <= _READ_FILE_LIMIT:
+            # Decode the whole file in one call rather than chunk by chunk
+            content = path.read_bytes().decode(encoding)
+        else:
+            with open(path, 'rb') as f:
+                data = f.read(_READ_FILE_LIMIT)
+            # A non-final incremental decode drops a character split by the cut
+            content = codecs.getincrementaldecoder(encoding)().decode(data, final=False)
         
-        Returns:
-            Success message or error description
-        """
-        try:
-            path = safe_path(file_path)
-            
-            if create_dirs:
-                path.parent.mkdir(parents=True, exist_ok=True)
-            
+        # Match the newline translation of text-mode reads
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+        
+        if size > _READ_FILE_LIMIT:
+            content += f"\n\n... [truncated: showing the first {format_size(_READ_FILE_LIMIT)} of {format_size(size)}]"
+        return content
+    except Exception as e:
+        return f"Error reading file: {str(e)}"
+
+def write_file(file_path: str, content: str, encoding: str = "utf-8", create_dirs: bool = True) -> str:
+    """
+    Write content to a file.
+    
+    Args:
+        file_path: Path to the file to write
+        content: Content to write to the file
+        encoding: Text encoding to use (default: utf-8)
+        create_dirs: Whether to create parent directories if they don't exist
+    
+    Returns:
+        Success message or error description
+    """
+    try:
+        path = safe_path(file_path)
+        
+        def write():
             with open(path, 'w', encoding=encoding) as f:
                 f.write(content)
-            
-            return f"Successfully wrote {len(content)} characters to '{file_path}'"
-        except Exception as e:
-            return f"Error writing file: {str(e)}"
-
-    @mcp.tool
-    def delete_file(file_path: str) -> str:
-        """
-        Delete a file.
         
-        Args:
-            file_path: Path to the file to delete
+        if create_dirs:
+            _with_parent_dir(path, write)
+        else:
+            write()
         
-        Returns:
-            Success message or error description
-        """
-        try:
-            path = safe_path(file_path)
-            if not path.exists():
-                return f"Error: File '{file_path}' does not exist"
-            if not path.is_file():
-                return f"Error: '{file_path}' is not a file"
-            
-            path.unlink()
-            return f"Successfully deleted file '{file_path}'"
-        except Exception as e:
-            return f"Error deleting file: {str(e)}"
+        return f"Successfully wrote {len(content)} characters to '{file_path}'"
+    except Exception as e:
+        return f"Error writing file: {str(e)}"
 
-    @mcp.tool
-    def list_directory(dir_path: str = ".", include_hidden: bool = False, detailed: bool = False) -> str:
-        """
-        List the contents of a directory.
+def delete_file(file_path: str) -> str:
+    """
+    Delete a file.
+    
+    Args:
+        file_path: Path to the file to delete
+    
+    Returns:
+        Success message or error description
+    """
+    try:
+        path = safe_path(file_path)
+        if not path.exists():
+            return f"Error: File '{file_path}' does not exist"
+        if not path.is_file():
+            return f"Error: '{file_path}' is not a file"
         
-        Args:
-            dir_path: Path to the directory to list (default: current directory)
-            include_hidden: Whether to include hidden files/directories
-            detailed: Whether to include detailed information (size, permissions, etc.)
+        path.unlink()
+        return f"Successfully deleted file '{file_path}'"
+    except Exception as e:
+        return f"Error deleting file: {str(e)}"
+
+def list_directory(dir_path: str = ".", include_hidden: bool = False, detailed: bool = False) -> str:
+    """
+    List the contents of a directory.
+    
+    Args:
+        dir_path: Path to the directory to list (default: current directory)
+        include_hidden: Whether to include hidden files/directories
+        detailed: Whether to include detailed information (size, permissions, etc.)
+    
+    Returns:
+        Directory listing as formatted text
+    """
+    try:
+        path = safe_path(dir_path)
+        if not path.exists():
+            return f"Error: Directory '{dir_path}' does not exist"
+        if not path.is_dir():
+            return f"Error: '{dir_path}' is not a directory"
         
-        Returns:
-            Directory listing as formatted text
-        """
-        try:
-            path = safe_path(dir_path)
-            if not path.exists():
-                return f"Error: Directory '{dir_path}' does not exist"
-            if not path.is_dir():
-                return f"Error: '{dir_path}' is not a directory"
-            
-            items = []
-            for item in path.iterdir():
-                if not include_hidden and item.name.startswith('.'):
+        entries_found = []
+        # scandir entries cache the file type from the directory read,
+        # so only detailed listings pay for a stat call
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if not include_hidden and entry.name.startswith('.'):
                     continue
                 
-                if detailed:
-                    stat_info = item.stat()
-                    size = stat_info.st_size
-                    modified = datetime.fromtimestamp(stat_info.st_mtime).strftime("%Y-%m-%d %H:%M:%S")
-                    is_dir = "DIR" if item.is_dir() else "FILE"
-                    permissions = oct(stat.S_IMODE(stat_info.st_mode))
-                    items.append(f"{is_dir:4} {size:>10} {permissions:>6} {modified} {item.name}")
-                else:
-                    items.append(f"{'[DIR]' if item.is_dir() else '[FILE]'} {item.name}")
-            
-            if not items:
-                return f"Directory '{dir_path}' is empty"
-            
-            header = "TYPE       SIZE  PERMS       MODIFIED           NAME" if detailed else "CONTENTS"
-            return f"Directory listing for '{dir_path}':\n{header}\n" + "\n".join(sorted(items))
-        except Exception as e:
-            return f"Error listing directory: {str(e)}"
+                stat_info = entry.stat() if detailed else None
+                entries_found.append((not entry.is_dir(), entry.name, stat_info))
+        
+        if not entries_found:
+            return f"Directory '{dir_path}' is empty"
+        
+        # Directories first, then by name; format only after sorting
+        entries_found.sort(key=lambda e: (e[0], e[1]))
+        
+        items = []
+        for is_file, name, stat_info in entries_found:
+            if detailed:
+                size = stat_info.st_size
+                modified = format_timestamp(stat_info.st_mtime)
+                is_dir = "FILE" if is_file else "DIR"
+                permissions = oct(stat.S_IMODE(stat_info.st_mode))
+                items.append(f"{is_dir:4} {size:>10} {permissions:>6} {modified} {name}")
+            else:
+                items.append(f"{'[FILE]' if is_file else '[DIR]'} {name}")
+        
+        header = "TYPE       SIZE  PERMS       MODIFIED           NAME" if detailed else "CONTENTS"
+        return f"Directory listing for '{dir_path}':\n{header}\n" + "\n".join(items)
+    except Exception as e:
+        return f"Error listing directory: {str(e)}"
+
+def create_directory(dir_path: str, parents: bool = True) -> str:
+    """
+    Create a directory.
+    
+    Args:
+        dir_path: Path to the directory to create
+        parents: Whether to create parent directories if they don't exist
+    
+    Returns:
+        Success message or error description
+    """
+    try:
+        path = safe_path(dir_path)
+        if path.exists():
+            return f"Error: Directory '{dir_path}' already exists"
+        
+        path.mkdir(parents=parents, exist_ok=False)
+        return f"Successfully created directory '{dir_path}'"
+    except Exception as e:
+        return f"Error creating directory: {str(e)}"
 
-    @mcp.tool
-    def create_directory(dir_path: str, parents: bool = True) -> str:
-        """
-        Create a directory.
+def delete_directory(dir_path: str, recursive: bool = False) -> str:
+    """
+    Delete a directory.
+    
+    Args:
+        dir_path: Path to the directory to delete
+        recursive: Whether to delete the directory and all its contents
+    
+    Returns:
+        Success message or error description
+    """
+    try:
+        path = safe_path(dir_path)
+        if not path.exists():
+            return f"Error: Directory '{dir_path}' does not exist"
+        if not path.is_dir():
+            return f"Error: '{dir_path}' is not a directory"
         
-        Args:
-            dir_path: Path to the directory to create
-            parents: Whether to create parent directories if they don't exist
+        if recursive:
+            _rmtree_parallel(str(path))
+            return f"Successfully deleted directory '{dir_path}' and all its contents"
+        else:
+            path.rmdir()  # Only works on empty directories
+            return f"Successfully deleted empty directory '{dir_path}'"
+    except Exception as e:
+        return f"Error deleting directory: {str(e)}"
+
+def search_files(pattern: str, directory: str = ".", recursive: bool = True, case_sensitive: bool = False) -> str:
+    """
+    Search for files matching a pattern.
+    
+    Args:
+        pattern: Glob pattern to search for (e.g., "*.py", "test_*.txt")
+        directory: Directory to search in (default: current directory)
+        recursive: Whether to search subdirectories
+        case_sensitive: Whether the search should be case-sensitive. Case-sensitive
+            recursive searches also follow symlinked directories; case-insensitive
+            ones do not.
+    
+    Returns:
+        List of matching files
+    """
+    try:
+        base_path = safe_path(directory)
+        if not base_path.exists():
+            return f"Error: Directory '{directory}' does not exist"
+        if not base_path.is_dir():
+            return f"Error: '{directory}' is not a directory"
         
-        Returns:
-            Success message or error description
-        """
-        try:
-            path = safe_path(dir_path)
-            if path.exists():
-                return f"Error: Directory '{dir_path}' already exists"
-            
-            path.mkdir(parents=parents, exist_ok=False)
-            return f"Successfully created directory '{dir_path}'"
-        except Exception as e:
-            return f"Error creating directory: {str(e)}"
+        # Compile the glob once instead of re-translating it for every file name
+        regex = re.compile(fnmatch.translate(pattern), 0 if case_sensitive else re.IGNORECASE)
+        if recursive:
+            # The case-sensitive search used glob's '**', which follows directory symlinks,
+            # and the case-insensitive one os.walk, which doesn't; both behaviours are kept
+            matches = _search_tree(str(base_path), regex, follow_symlinks=case_sensitive)
+        else:
+            matches = list(_iter_matching_files(str(base_path), regex, recursive=False))
+        
+        if not matches:
+            return f"No files found matching pattern '{pattern}' in '{directory}'"
+        
+        # Convert to relative paths and sort
+        relative_matches = [os.path.relpath(match, base_path) for match in matches]
+        return f"Found {len(matches)} files matching '{pattern}':\n" + "\n".join(sorted(relative_matches))
+    except Exception as e:
+        return f"Error searching files: {str(e)}"
 
-    @mcp.tool
-    def delete_directory(dir_path: str, recursive: bool = False) -> str:
-        """
-        Delete a directory.
+def get_file_info(file_path: str) -> str:
+    """
+    Get detailed information about a file or directory.
+    
+    Args:
+        file_path: Path to the file or directory
+    
+    Returns:
+        Detailed information including size, permissions, timestamps, etc.
+    """
+    try:
+        path = safe_path(file_path)
+        if not path.exists():
+            return f"Error: '{file_path}' does not exist"
         
-        Args:
-            dir_path: Path to the directory to delete
-            recursive: Whether to delete the directory and all its contents
+        stat_info = path.stat()
         
-        Returns:
-            Success message or error description
-        """
-        try:
-            path = safe_path(dir_path)
-            if not path.exists():
-                return f"Error: Directory '{dir_path}' does not exist"
-            if not path.is_dir():
-                return f"Error: '{dir_path}' is not a directory"
+        info = {
+            "path": str(path),
+            "name": path.name,
+            "type": "directory" if path.is_dir() else "file",
+            "size": stat_info.st_size,
+            "size_human": format_size(stat_info.st_size),
+            "permissions": oct(stat.S_IMODE(stat_info.st_mode)),
+            "owner_uid": stat_info.st_uid,
+            "group_gid": stat_info.st_gid,
+            "created": isoformat_timestamp(stat_info.st_ctime),
+            "modified": isoformat_timestamp(stat_info.st_mtime),
+            "accessed": isoformat_timestamp(stat_info.st_atime),
+        }
+        
+        if path.is_file():
+            info["extension"] = path.suffix
             
-            if recursive:
-                shutil.rmtree(path)
-                return f"Successfully deleted directory '{dir_path}' and all its contents"
-            else:
-                path.rmdir()  # Only works on empty directories
-                return f"Successfully deleted empty directory '{dir_path}'"
-        except Exception as e:
-            return f"Error deleting directory: {str(e)}"
+        return dumps_indented(info)
+    except Exception as e:
+        return f"Error getting file info: {str(e)}"
 
-    @mcp.tool
-    def search_files(pattern: str, directory: str = ".", recursive: bool = True, case_sensitive: bool = False) -> str:
-        """
-        Search for files matching a pattern.
+def copy_file(source_path: str, destination_path: str, overwrite: bool = False, data_only: bool = False) -> str:
+    """
+    Copy a file from source to destination.
+    
+    Args:
+        source_path: Path to the source file
+        destination_path: Path to the destination
+        overwrite: Whether to overwrite the destination if it exists
+        data_only: Copy only the contents, skipping permission bits and timestamps
+    
+    Returns:
+        Success message or error description
+    """
+    try:
+        src = safe_path(source_path)
+        dst = safe_path(destination_path)
         
-        Args:
-            pattern: Glob pattern to search for (e.g., "*.py", "test_*.txt")
-            directory: Directory to search in (default: current directory)
-            recursive: Whether to search subdirectories
-            case_sensitive: Whether the search should be case-sensitive
+        if not src.exists():
+            return f"Error: Source file '{source_path}' does not exist"
+        if not src.is_file():
+            return f"Error: Source '{source_path}' is not a file"
         
-        Returns:
-            List of matching files
-        """
-        try:
-            base_path = safe_path(directory)
-            if not base_path.exists():
-                return f"Error: Directory '{directory}' does not exist"
-            if not base_path.is_dir():
-                return f"Error: '{directory}' is not a directory"
-            
-            if recursive:
-                search_pattern = str(base_path / "**" / pattern)
-                matches = glob.glob(search_pattern, recursive=True)
-            else:
-                search_pattern = str(base_path / pattern)
-                matches = glob.glob(search_pattern)
-            
-            if not case_sensitive:
-                # For case-insensitive search, we need to manually filter
-                all_files = []
-                for root, dirs, files in os.walk(base_path) if recursive else [(base_path, [], os.listdir(base_path))]:
-                    for file in files:
-                        if not case_sensitive:
-                            if pattern.lower() in file.lower() or glob.fnmatch.fnmatch(file.lower(), pattern.lower()):
-                                all_files.append(os.path.join(root, file))
-                        else:
-                            if glob.fnmatch.fnmatch(file, pattern):
-                                all_files.append(os.path.join(root, file))
-                matches = all_files if not case_sensitive else matches
-            
-            if not matches:
-                return f"No files found matching pattern '{pattern}' in '{directory}'"
-            
-            # Convert to relative paths and sort
-            relative_matches = [os.path.relpath(match, base_path) for match in matches]
-            return f"Found {len(matches)} files matching '{pattern}':\n" + "\n".join(sorted(relative_matches))
-        except Exception as e:
-            return f"Error searching files: {str(e)}"
+        if dst.exists() and not overwrite:
+            return f"Error: Destination '{destination_path}' already exists. Use overwrite=True to replace it"
+        
+        if data_only:
+            # copyfile goes straight to the kernel copy fast path and skips copystat,
+            # which also avoids metadata errors on filesystems such as FAT
+            if dst.is_dir():
+                dst = dst / src.name
+            copy = shutil.copyfile
+        else:
+            copy = shutil.copy2
+        
+        # Create parent directories if they don't exist
+        _with_parent_dir(dst, lambda: copy(src, dst))
+        return f"Successfully copied '{source_path}' to '{destination_path}'"
+    except Exception as e:
+        return f"Error copying file: {str(e)}"
 
-    @mcp.tool
-    def get_file_info(file_path: str) -> str:
-        """
-        Get detailed information about a file or directory.
+def move_file(source_path: str, destination_path: str, overwrite: bool = False) -> str:
+    """
+    Move a file from source to destination.
+    
+    Args:
+        source_path: Path to the source file
+        destination_path: Path to the destination
+        overwrite: Whether to overwrite the destination if it exists
+    
+    Returns:
+        Success message or error description
+    """
+    try:
+        src = safe_path(source_path)
+        dst = safe_path(destination_path)
         
-        Args:
-            file_path: Path to the file or directory
+        if not src.exists():
+            return f"Error: Source '{source_path}' does not exist"
         
-        Returns:
-            Detailed information including size, permissions, timestamps, etc.
-        """
-        try:
-            path = safe_path(file_path)
-            if not path.exists():
-                return f"Error: '{file_path}' does not exist"
-            
-            stat_info = path.stat()
-            
-            info = {
-                "path": str(path),
-                "name": path.name,
-                "type": "directory" if path.is_dir() else "file",
-                "size": stat_info.st_size,
-                "size_human": _format_size(stat_info.st_size),
-                "permissions": oct(stat.S_IMODE(stat_info.st_mode)),
-                "owner_uid": stat_info.st_uid,
-                "group_gid": stat_info.st_gid,
-                "created": datetime.fromtimestamp(stat_info.st_ctime).isoformat(),
-                "modified": datetime.fromtimestamp(stat_info.st_mtime).isoformat(),
-                "accessed": datetime.fromtimestamp(stat_info.st_atime).isoformat(),
-            }
-            
-            if path.is_file():
-                info["extension"] = path.suffix
-                
-            return json.dumps(info, indent=2)
-        except Exception as e:
-            return f"Error getting file info: {str(e)}"
+        if dst.exists() and not overwrite:
+            return f"Error: Destination '{destination_path}' already exists. Use overwrite=True to replace it"
+        
+        # Create parent directories if they don't exist
+        _with_parent_dir(dst, lambda: shutil.move(str(src), str(dst)))
+        return f"Successfully moved '{source_path}' to '{destination_path}'"
+    except Exception as e:
+        return f"Error moving file: {str(e)}"
 
-    @mcp.tool
-    def copy_file(source_path: str, destination_path: str, overwrite: bool = False) -> str:
-        """
-        Copy a file from source to destination.
+def format_json_file(filepath: str) -> str:
+    """Format/pretty-print a JSON file"""
+    try:
+        path = safe_path(filepath)
+        if not path.exists():
+            return f"Error: File '{filepath}' does not exist"
+        if not path.is_file():
+            return f"Error: '{filepath}' is not a file"
         
-        Args:
-            source_path: Path to the source file
-            destination_path: Path to the destination
-            overwrite: Whether to overwrite the destination if it exists
+        # Decode the file in one call and write the result in one call,
+        # instead of json.dump's many small writes through the text layer
+        data = json.loads(path.read_bytes())
+        path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
         
-        Returns:
-            Success message or error description
-        """
-        try:
-            src = safe_path(source_path)
-            dst = safe_path(destination_path)
-            
-            if not src.exists():
-                return f"Error: Source file '{source_path}' does not exist"
-            if not src.is_file():
-                return f"Error: Source '{source_path}' is not a file"
-            
-            if dst.exists() and not overwrite:
-                return f"Error: Destination '{destination_path}' already exists. Use overwrite=True to replace it"
-            
-            # Create parent directories if they don't exist
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            
-            shutil.copy2(src, dst)
-            return f"Successfully copied '{source_path}' to '{destination_path}'"
-        except Exception as e:
-            return f"Error copying file: {str(e)}"
+        return f"Successfully formatted JSON file '{filepath}'"
+    except json.JSONDecodeError as e:
+        return f"Error: Invalid JSON in file '{filepath}': {str(e)}"
+    except Exception as e:
+        return f"Error formatting JSON file: {str(e)}"
 
-    @mcp.tool
-    def move_file(source_path: str, destination_path: str, overwrite: bool = False) -> str:
-        """
-        Move a file from source to destination.
+def validate_json_file(filepath: str) -> str:
+    """Check if a JSON file is valid"""
+    try:
+        path = safe_path(filepath)
+        if not path.exists():
+            return f"Error: File '{filepath}' does not exist"
+        if not path.is_file():
+            return f"Error: '{filepath}' is not a file"
         
-        Args:
-            source_path: Path to the source file
-            destination_path: Path to the destination
-            overwrite: Whether to overwrite the destination if it exists
+        with open(path, 'r', encoding='utf-8') as f:
+            json.load(f)
         
-        Returns:
-            Success message or error description
-        """
-        try:
-            src = safe_path(source_path)
-            dst = safe_path(destination_path)
-            
-            if not src.exists():
-                return f"Error: Source '{source_path}' does not exist"
-            
-            if dst.exists() and not overwrite:
-                return f"Error: Destination '{destination_path}' already exists. Use overwrite=True to replace it"
-            
-            # Create parent directories if they don't exist
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            
-            shutil.move(str(src), str(dst))
-            return f"Successfully moved '{source_path}' to '{destination_path}'"
-        except Exception as e:
-            return f"Error moving file: {str(e)}"
+        return f"JSON file '{filepath}' is valid"
+    except json.JSONDecodeError as e:
+        return f"Error: Invalid JSON in file '{filepath}': {str(e)}"
+    except Exception as e:
+        return f"Error validating JSON file: {str(e)}"
 
-    @mcp.tool
-    def format_json_file(filepath: str) -> str:
-        """Format/pretty-print a JSON file"""
-        try:
-            path = safe_path(filepath)
-            if not path.exists():
-                return f"Error: File '{filepath}' does not exist"
-            if not path.is_file():
-                return f"Error: '{filepath}' is not a file"
-            
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            return f"Successfully formatted JSON file '{filepath}'"
-        except json.JSONDecodeError as e:
-            return f"Error: Invalid JSON in file '{filepath}': {str(e)}"
-        except Exception as e:
-            return f"Error formatting JSON file: {str(e)}"
+# Tools exposed by register_file_system_tools, in registration order
+_FILE_SYSTEM_TOOLS = (
+    read_file,
+    write_file,
+    delete_file,
+    list_directory,
+    create_directory,
+    delete_directory,
+    search_files,
+    get_file_info,
+    copy_file,
+    move_file,
+    format_json_file,
+    validate_json_file,
+)
 
-    @mcp.tool
-    def validate_json_file(filepath: str) -> str:
-        """Check if a JSON file is valid"""
-        try:
-            path = safe_path(filepath)
-            if not path.exists():
-                return f"Error: File '{filepath}' does not exist"
-            if not path.is_file():
-                return f"Error: '{filepath}' is not a file"
-            
-            with open(path, 'r', encoding='utf-8') as f:
-                json.load(f)
-            
-            return f"JSON file '{filepath}' is valid"
-        except json.JSONDecodeError as e:
-            return f"Error: Invalid JSON in file '{filepath}': {str(e)}"
-        except Exception as e:
-            return f"Error validating JSON file: {str(e)}"
+def register_file_system_tools(mcp: FastMCP):
+    """Register all file system related tools"""
+    for tool in _FILE_SYSTEM_TOOLS:
+        mcp.tool(tool)
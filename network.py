@@ -1,7 +1,6 @@
 import socket
 import subprocess
 import platform
-import psutil
 from fastmcp import FastMCP
 
 def register_network_tools(mcp: FastMCP):
@@ -12,8 +11,13 @@ def register_network_tools(mcp: FastMCP):
         """Ping a hostname and return response time"""
         try:
             # Use appropriate ping command based on OS
-            if platform.system().lower() == "windows":
+            system = platform.system().lower()
+            if system == "windows":
                 cmd = ["ping", "-n", "4", hostname]
+            elif system == "linux":
+                # 0.2s is the shortest probe interval iputils allows unprivileged users,
+                # cutting the wait from ~3s of spacing to ~0.6s
+                cmd = ["ping", "-c", "4", "-i", "0.2", hostname]
             else:
                 cmd = ["ping", "-c", "4", hostname]
             
@@ -31,24 +35,23 @@ def register_network_tools(mcp: FastMCP):
     @mcp.tool
     def get_network_interfaces() -> str:
         """List all network interfaces and their IP addresses"""
+        import psutil
         try:
             interfaces = psutil.net_if_addrs()
-            result = "Network Interfaces:\n"
+            parts = ["Network Interfaces:\n"]
             
             for interface, addresses in interfaces.items():
-                result += f"\n{interface}:\n"
+                parts.append(f"\n{interface}:\n")
                 for addr in addresses:
                     if addr.family == socket.AF_INET:  # IPv4
-                        result += f"  IPv4: {addr.address}"
-                        if addr.netmask:
-                            result += f" (netmask: {addr.netmask})"
-                        result += "\n"
+                        netmask = f" (netmask: {addr.netmask})" if addr.netmask else ""
+                        parts.append(f"  IPv4: {addr.address}{netmask}\n")
                     elif addr.family == socket.AF_INET6:  # IPv6
-                        result += f"  IPv6: {addr.address}\n"
+                        parts.append(f"  IPv6: {addr.address}\n")
                     elif hasattr(socket, 'AF_PACKET') and addr.family == socket.AF_PACKET:  # MAC
-                        result += f"  MAC: {addr.address}\n"
+                        parts.append(f"  MAC: {addr.address}\n")
             
-            return result
+            return ''.join(parts)
         except Exception as e:
             return f"Error getting network interfaces: {str(e)}"
 
@@ -56,26 +59,35 @@ def register_network_tools(mcp: FastMCP):
     def check_port_open(host: str, port: int) -> str:
         """Check if a specific port is open on a host"""
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(5)
-            result = sock.connect_ex((host, port))
-            sock.close()
-            
-            if result == 0:
-                return f"Port {port} on {host} is OPEN"
-            else:
-                return f"Port {port} on {host} is CLOSED or filtered"
+            # create_connection tries every getaddrinfo result, so IPv6-only hosts work too
+            with socket.create_connection((host, port), timeout=5) as sock:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+            return f"Port {port} on {host} is OPEN"
+        except socket.gaierror as e:
+            return f"Error: Could not resolve host '{host}': {str(e)}"
+        except ConnectionRefusedError:
+            return f"Port {port} on {host} is CLOSED (connection refused)"
+        except socket.timeout:
+            return f"Port {port} on {host} is CLOSED or filtered (timed out)"
+        except OSError:
+            return f"Port {port} on {host} is CLOSED or filtered"
         except Exception as e:
             return f"Error checking port: {str(e)}"
 
     @mcp.tool
     def get_active_connections() -> str:
         """Show active network connections"""
+        import psutil
         try:
             connections = psutil.net_connections(kind='inet')
-            result = "Active Network Connections:\n"
-            result += f"{'Protocol':<8} {'Local Address':<22} {'Remote Address':<22} {'Status':<12} {'PID':<8}\n"
-            result += "-" * 80 + "\n"
+            parts = [
+                "Active Network Connections:\n",
+                f"{'Protocol':<8} {'Local Address':<22} {'Remote Address':<22} {'Status':<12} {'PID':<8}\n",
+                "-" * 80 + "\n",
+            ]
             
             for conn in connections:
                 protocol = "TCP" if conn.type == socket.SOCK_STREAM else "UDP"
@@ -84,8 +96,8 @@ def register_network_tools(mcp: FastMCP):
                 status = conn.status if conn.status else "N/A"
                 pid = str(conn.pid) if conn.pid else "N/A"
                 
-                result += f"{protocol:<8} {local:<22} {remote:<22} {status:<12} {pid:<8}\n"
+                parts.append(f"{protocol:<8} {local:<22} {remote:<22} {status:<12} {pid:<8}\n")
             
-            return result
+            return ''.join(parts)
         except Exception as e:
             return f"Error getting active connections: {str(e)}"
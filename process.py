@@ -1,15 +1,65 @@
-import json
-import psutil
-from datetime import datetime
+import heapq
+import threading
+import time
 from fastmcp import FastMCP
+from utils import format_size, dumps_indented, isoformat_timestamp
 
-def _format_size(size_bytes: int) -> str:
-    """Convert bytes to human-readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} PB"
+# Union of the per-process attributes the listing tools need, so one
+# process_iter pass can serve all of them
+_SNAPSHOT_ATTRS = ['pid', 'name', 'cpu_percent', 'memory_info', 'status']
+_SNAPSHOT_TTL = 1.0
+
+# Last process table scan: (timestamp, rows)
+_snapshot = None
+_snapshot_lock = threading.Lock()
+
+def _get_snapshot(ttl: float = _SNAPSHOT_TTL) -> list:
+    """
+    Return one info dict per running process, reusing a scan taken within the last ttl seconds.
+    
+    Rows carry the _SNAPSHOT_ATTRS fields plus a precomputed 'memory_rss'.
+    The list is shared between callers, so it must not be modified in place.
+    """
+    import psutil
+    global _snapshot
+    with _snapshot_lock:
+        now = time.monotonic()
+        if _snapshot is not None and now - _snapshot[0] < ttl:
+            return _snapshot[1]
+        
+        rows = []
+        for proc in psutil.process_iter(_SNAPSHOT_ATTRS):
+            info = proc.info
+            info['memory_rss'] = info['memory_info'].rss if info['memory_info'] else 0
+            rows.append(info)
+        _snapshot = (now, rows)
+        return rows
+
+def _fresh_snapshot(ttl: float = _SNAPSHOT_TTL):
+    """Return the cached snapshot rows if taken within the last ttl seconds, otherwise None"""
+    with _snapshot_lock:
+        if _snapshot is not None and time.monotonic() - _snapshot[0] < ttl:
+            return _snapshot[1]
+    return None
+
+def _iter_name_matches(name: str, first_only: bool = False):
+    """
+    Yield info dicts for processes whose name contains name, case-insensitively.
+    
+    A first_only search without a fresh snapshot scans process names lazily,
+    so it can stop at the first match instead of reading the whole table.
+    """
+    import psutil
+    name_lower = name.lower()
+    rows = _fresh_snapshot() if first_only else _get_snapshot()
+    if rows is None:
+        rows = (proc.info for proc in psutil.process_iter(['pid', 'name']))
+    
+    for info in rows:
+        if info['name'] and name_lower in info['name'].lower():
+            yield info
+            if first_only:
+                return
 
 def register_process_tools(mcp: FastMCP):
     """Register all process management related tools"""
@@ -17,29 +67,54 @@ def register_process_tools(mcp: FastMCP):
     @mcp.tool
     def get_process_tree(pid: int) -> str:
         """Show process tree for a given PID (parent/child relationships)"""
+        import psutil
         try:
             process = psutil.Process(pid)
             
-            def build_tree(proc, level=0):
-                indent = "  " * level
+            # One sweep for all descendants, then group them under their parents
+            descendants = process.children(recursive=True)
+            children_of = {}
+            for child in descendants:
+                try:
+                    children_of.setdefault(child.ppid(), []).append(child)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+            
+            # cpu_percent() measures since its previous call on the same object, so prime
+            # every node, wait once for the whole tree, then take the real readings
+            tree_procs = [process] + descendants
+            for proc in tree_procs:
+                try:
+                    proc.cpu_percent()
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+            time.sleep(0.1)
+            cpu_by_pid = {}
+            for proc in tree_procs:
                 try:
-                    name = proc.name()
-                    cpu = proc.cpu_percent()
-                    memory = proc.memory_info().rss
-                    result = f"{indent}├─ {proc.pid} {name} (CPU: {cpu}%, Memory: {_format_size(memory)})\n"
-                    
-                    children = proc.children()
-                    for child in children:
-                        result += build_tree(child, level + 1)
-                    
-                    return result
+                    cpu_by_pid[proc.pid] = proc.cpu_percent()
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    return f"{indent}├─ {proc.pid} <access denied>\n"
+                    pass
             
-            result = f"Process Tree for PID {pid}:\n"
-            result += build_tree(process)
+            parts = [f"Process Tree for PID {pid}:\n"]
+            stack = [(process, 0)]
+            while stack:
+                proc, level = stack.pop()
+                indent = "  " * level
+                try:
+                    with proc.oneshot():
+                        name = proc.name()
+                        memory = proc.memory_info().rss
+                    cpu = cpu_by_pid.get(proc.pid, 0.0)
+                    parts.append(f"{indent}├─ {proc.pid} {name} (CPU: {cpu}%, Memory: {format_size(memory)})\n")
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    parts.append(f"{indent}├─ {proc.pid} <access denied>\n")
+                
+                # Push in reverse so children are rendered in ascending PID order
+                children = sorted(children_of.get(proc.pid, ()), key=lambda p: p.pid, reverse=True)
+                stack.extend((child, level + 1) for child in children)
             
-            return result
+            return ''.join(parts)
         except psutil.NoSuchProcess:
             return f"Error: Process with PID {pid} not found"
         except Exception as e:
@@ -49,21 +124,14 @@ def register_process_tools(mcp: FastMCP):
     def get_top_cpu_processes(limit: int = 5) -> str:
         """Get top N processes by CPU usage"""
         try:
-            processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent']):
-                try:
-                    processes.append(proc.info)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
-            
-            # Sort by CPU usage
-            processes.sort(key=lambda x: x['cpu_percent'] or 0, reverse=True)
+            # Select the busiest processes without sorting the whole table
+            processes = heapq.nlargest(limit, _get_snapshot(), key=lambda x: x['cpu_percent'] or 0)
             
             result = f"Top {limit} processes by CPU usage:\n"
             result += f"{'PID':<8} {'CPU%':<8} {'Name'}\n"
             result += "-" * 40 + "\n"
             
-            for proc in processes[:limit]:
+            for proc in processes:
                 pid = proc['pid']
                 cpu = proc['cpu_percent'] or 0
                 name = proc['name'] or 'N/A'
@@ -77,25 +145,16 @@ def register_process_tools(mcp: FastMCP):
     def get_top_memory_processes(limit: int = 5) -> str:
         """Get top N processes by memory usage"""
         try:
-            processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'memory_info']):
-                try:
-                    info = proc.info
-                    info['memory_rss'] = info['memory_info'].rss if info['memory_info'] else 0
-                    processes.append(info)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
-            
-            # Sort by memory usage
-            processes.sort(key=lambda x: x['memory_rss'], reverse=True)
+            # Select the largest processes without sorting the whole table
+            processes = heapq.nlargest(limit, _get_snapshot(), key=lambda x: x['memory_rss'])
             
             result = f"Top {limit} processes by memory usage:\n"
             result += f"{'PID':<8} {'Memory':<12} {'Name'}\n"
             result += "-" * 40 + "\n"
             
-            for proc in processes[:limit]:
+            for proc in processes:
                 pid = proc['pid']
-                memory = _format_size(proc['memory_rss'])
+                memory = format_size(proc['memory_rss'])
                 name = proc['name'] or 'N/A'
                 result += f"{pid:<8} {memory:<12} {name}\n"
             
@@ -104,18 +163,15 @@ def register_process_tools(mcp: FastMCP):
             return f"Error getting top memory processes: {str(e)}"
 
     @mcp.tool
-    def check_if_process_running(name: str) -> str:
-        """Check if a process with given name is currently running"""
+    def check_if_process_running(name: str, first_only: bool = False) -> str:
+        """Check if a process with given name is currently running (first_only stops at the first match)"""
         try:
-            running_processes = []
-            for proc in psutil.process_iter(['pid', 'name']):
-                try:
-                    if name.lower() in proc.info['name'].lower():
-                        running_processes.append(proc.info)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
+            running_processes = list(_iter_name_matches(name, first_only))
             
             if running_processes:
+                if first_only:
+                    proc = running_processes[0]
+                    return f"Process matching '{name}' is running: PID {proc['pid']}: {proc['name']}"
                 result = f"Found {len(running_processes)} process(es) matching '{name}':\n"
                 for proc in running_processes:
                     result += f"  PID {proc['pid']}: {proc['name']}\n"
@@ -129,37 +185,31 @@ def register_process_tools(mcp: FastMCP):
     def list_processes() -> str:
         """List all running processes with PID, name, and CPU usage"""
         try:
-            processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info', 'status']):
-                try:
-                    info = proc.info
-                    info['memory_rss'] = info['memory_info'].rss if info['memory_info'] else 0
-                    processes.append(info)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
-            
             # Sort by PID
-            processes.sort(key=lambda x: x['pid'])
+            processes = sorted(_get_snapshot(), key=lambda x: x['pid'])
             
-            result = f"Running Processes ({len(processes)} total):\n"
-            result += f"{'PID':<8} {'CPU%':<8} {'Memory':<12} {'Status':<12} {'Name'}\n"
-            result += "-" * 60 + "\n"
+            parts = [
+                f"Running Processes ({len(processes)} total):\n",
+                f"{'PID':<8} {'CPU%':<8} {'Memory':<12} {'Status':<12} {'Name'}\n",
+                "-" * 60 + "\n",
+            ]
             
             for proc in processes:
                 pid = proc['pid']
                 cpu = proc['cpu_percent'] or 0
-                memory = _format_size(proc['memory_rss'])
+                memory = format_size(proc['memory_rss'])
                 status = proc['status'] or 'N/A'
                 name = proc['name'] or 'N/A'
-                result += f"{pid:<8} {cpu:<8.1f} {memory:<12} {status:<12} {name}\n"
+                parts.append(f"{pid:<8} {cpu:<8.1f} {memory:<12} {status:<12} {name}\n")
             
-            return result
+            return ''.join(parts)
         except Exception as e:
             return f"Error listing processes: {str(e)}"
 
     @mcp.tool
     def get_process_info(pid: int) -> str:
         """Get detailed info about a specific process by PID"""
+        import psutil
         try:
             process = psutil.Process(pid)
             
@@ -169,11 +219,11 @@ def register_process_tools(mcp: FastMCP):
                 "exe": process.exe(),
                 "cwd": process.cwd(),
                 "status": process.status(),
-                "create_time": datetime.fromtimestamp(process.create_time()).isoformat(),
+                "create_time": isoformat_timestamp(process.create_time()),
                 "cpu_percent": process.cpu_percent(),
                 "memory_info": {
-                    "rss": _format_size(process.memory_info().rss),
-                    "vms": _format_size(process.memory_info().vms)
+                    "rss": format_size(process.memory_info().rss),
+                    "vms": format_size(process.memory_info().vms)
                 },
                 "num_threads": process.num_threads(),
                 "username": process.username()
@@ -193,7 +243,7 @@ def register_process_tools(mcp: FastMCP):
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 info["cmdline"] = "N/A"
             
-            return json.dumps(info, indent=2)
+            return dumps_indented(info)
         except psutil.NoSuchProcess:
             return f"Error: Process with PID {pid} not found"
         except psutil.AccessDenied:
@@ -205,31 +255,25 @@ def register_process_tools(mcp: FastMCP):
     def find_process_by_name(name: str) -> str:
         """Find processes by name (partial match)"""
         try:
-            matching_processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info', 'status']):
-                try:
-                    if name.lower() in proc.info['name'].lower():
-                        info = proc.info
-                        info['memory_rss'] = info['memory_info'].rss if info['memory_info'] else 0
-                        matching_processes.append(info)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
+            matching_processes = list(_iter_name_matches(name))
             
             if not matching_processes:
                 return f"No processes found matching '{name}'"
             
-            result = f"Found {len(matching_processes)} process(es) matching '{name}':\n"
-            result += f"{'PID':<8} {'CPU%':<8} {'Memory':<12} {'Status':<12} {'Name'}\n"
-            result += "-" * 60 + "\n"
+            parts = [
+                f"Found {len(matching_processes)} process(es) matching '{name}':\n",
+                f"{'PID':<8} {'CPU%':<8} {'Memory':<12} {'Status':<12} {'Name'}\n",
+                "-" * 60 + "\n",
+            ]
             
             for proc in matching_processes:
                 pid = proc['pid']
                 cpu = proc['cpu_percent'] or 0
-                memory = _format_size(proc['memory_rss'])
+                memory = format_size(proc['memory_rss'])
                 status = proc['status'] or 'N/A'
-                name = proc['name'] or 'N/A'
-                result += f"{pid:<8} {cpu:<8.1f} {memory:<12} {status:<12} {name}\n"
+                proc_name = proc['name'] or 'N/A'
+                parts.append(f"{pid:<8} {cpu:<8.1f} {memory:<12} {status:<12} {proc_name}\n")
             
-            return result
+            return ''.join(parts)
         except Exception as e:
             return f"Error finding processes: {str(e)}"
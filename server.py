@@ -3,6 +3,7 @@ from file_system import register_file_system_tools
 from process import register_process_tools
 from system_resource import register_system_resource_tools
 from network import register_network_tools
+from development import register_development_tools
 
 # Create the main MCP server instance
 mcp = FastMCP("System Monitoring & File Helper")
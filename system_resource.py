@@ -3,49 +3,254 @@ import json
 import shutil
 import subprocess
 import platform
-import psutil
-import pkg_resources
-import winreg
+import functools
+import threading
+import time
+from concurrent import futures
 from fastmcp import FastMCP
+from utils import format_size
 
-def _format_size(size_bytes: int) -> str:
-    """Convert bytes to human-readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} PB"
+_IS_WINDOWS = platform.system() == "Windows"
+if _IS_WINDOWS:
+    import winreg
+
+@functools.lru_cache(maxsize=None)
+def _cpu_counts() -> tuple:
+    """Return (physical, logical) core counts, which cannot change while the process runs"""
+    import psutil
+    return psutil.cpu_count(logical=False), psutil.cpu_count(logical=True)
+
+# psutil.cpu_freq() only tracks the live clock speed on Linux; elsewhere it
+# reports fixed nominal values, which need reading only once
+_CPU_FREQ_IS_LIVE = platform.system() == "Linux"
+
+@functools.lru_cache(maxsize=None)
+def _nominal_cpu_freq():
+    """Return the first psutil.cpu_freq() reading"""
+    import psutil
+    return psutil.cpu_freq()
+
+def _cpu_freq():
+    """Return psutil.cpu_freq(), queried afresh only where the current value can change"""
+    if _CPU_FREQ_IS_LIVE:
+        import psutil
+        return psutil.cpu_freq()
+    return _nominal_cpu_freq()
+
+@functools.lru_cache(maxsize=None)
+def _platform_details() -> tuple:
+    """Return (processor, machine, platform string), which cannot change while the process runs"""
+    return platform.processor(), platform.machine(), platform.platform()
+
+# get_windows_version output, built once; the registry values it reads only change across reboots
+_windows_version_text = None
+
+# Last system CPU reading: (timestamp, percent); readings younger than the TTL are reused
+_CPU_PERCENT_TTL = 2.0
+_cpu_sample = None
+_cpu_sample_lock = threading.Lock()
+
+def _cpu_percent() -> float:
+    """
+    Return system-wide CPU usage, blocking for a 1s sample only on the first call.
+    
+    psutil.cpu_percent(interval=None) reports usage since its previous call,
+    so after the first blocking sample each later reading covers the time
+    since the one before it, which the TTL keeps at 2s or more.
+    """
+    import psutil
+    global _cpu_sample
+    with _cpu_sample_lock:
+        now = time.monotonic()
+        if _cpu_sample is not None and now - _cpu_sample[0] < _CPU_PERCENT_TTL:
+            return _cpu_sample[1]
+        
+        percent = psutil.cpu_percent(interval=1 if _cpu_sample is None else None)
+        _cpu_sample = (time.monotonic(), percent)
+        return percent
+
+# Total time get_hardware_information waits for disk_usage; a drive that is
+# spinning up or unresponsive could otherwise block it for seconds
+_DISK_USAGE_TIMEOUT = 0.25
+
+def _partition_usages() -> list:
+    """
+    Return (partition, usage, problem) for the mounted partitions worth querying.
+    
+    Optical drives and drives without media (empty fstype) are skipped. When a
+    drive is inaccessible or misses the shared deadline, usage is None and
+    problem describes why.
+    """
+    import psutil
+    partitions = [
+        partition for partition in psutil.disk_partitions(all=False)
+        if 'cdrom' not in partition.opts and partition.fstype
+    ]
+    if not partitions:
+        return []
+    
+    # Each slot receives the usage or the exception raised while reading it
+    results = [None] * len(partitions)
+    def probe(index, mountpoint):
+        try:
+            results[index] = psutil.disk_usage(mountpoint)
+        except Exception as e:
+            results[index] = e
+    
+    # Daemon threads, unlike a thread pool's workers, are not joined at
+    # interpreter exit, so a hung drive can't keep the process alive
+    threads = []
+    for index, partition in enumerate(partitions):
+        thread = threading.Thread(target=probe, args=(index, partition.mountpoint), daemon=True)
+        thread.start()
+        threads.append(thread)
+    
+    deadline = time.monotonic() + _DISK_USAGE_TIMEOUT
+    usages = []
+    for index, (partition, thread) in enumerate(zip(partitions, threads)):
+        thread.join(max(0.0, deadline - time.monotonic()))
+        result = results[index]
+        if result is None:
+            usages.append((partition, None, "Not responding"))
+        elif isinstance(result, PermissionError):
+            usages.append((partition, None, "Permission denied"))
+        elif isinstance(result, Exception):
+            raise result
+        else:
+            usages.append((partition, result, None))
+    return usages
+
+# When a probe last found no temperature sensors or no battery (time.monotonic());
+# on machines without them the probe is skipped until _SENSOR_ABSENT_TTL has passed,
+# since enumerating sensors on Windows is slow and almost always comes back empty
+_SENSOR_ABSENT_TTL = 60.0
+_no_temperatures_at = None
+_no_battery_at = None
+
+def _recently_absent(checked_at) -> bool:
+    """Return True if a sensor was found missing less than _SENSOR_ABSENT_TTL seconds ago"""
+    return checked_at is not None and time.monotonic() - checked_at < _SENSOR_ABSENT_TTL
+
+# Environment variable values longer than this are cut short for readability
+_ENV_VALUE_LIMIT = 100
+
+def _truncate_env_value(value: str) -> str:
+    """Shorten a value to _ENV_VALUE_LIMIT characters, marking the cut with '...'"""
+    return value if len(value) <= _ENV_VALUE_LIMIT else value[:_ENV_VALUE_LIMIT - 3] + "..."
+
+# check_command_exists lookups: command -> ((PATH, PATHEXT), resolved path or None, lookup time)
+_which_cache = {}
+# Misses are rechecked after this long so newly installed commands show up
+_WHICH_MISS_TTL = 30.0
+
+def _which(command: str):
+    """
+    shutil.which, remembered until PATH or PATHEXT changes.
+    
+    A remembered hit is reused while the file still exists; a remembered
+    miss is reused for _WHICH_MISS_TTL seconds.
+    """
+    search_path = (os.environ.get("PATH", ""), os.environ.get("PATHEXT", ""))
+    cache_key = command.lower() if _IS_WINDOWS else command
+    cached = _which_cache.get(cache_key)
+    if cached is not None and cached[0] == search_path:
+        _, result, looked_up = cached
+        if result is not None and os.path.isfile(result):
+            return result
+        if result is None and time.monotonic() - looked_up < _WHICH_MISS_TTL:
+            return None
+    
+    result = shutil.which(command)
+    _which_cache[cache_key] = (search_path, result, time.monotonic())
+    return result
+
+# Uninstall roots for both 32-bit and 64-bit registry locations
+if _IS_WINDOWS:
+    _UNINSTALL_KEYS = (
+        (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
+        (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"),
+        (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall")
+    )
+else:
+    _UNINSTALL_KEYS = ()
+
+# Last list_installed_applications output: (signature of the Uninstall roots, time.monotonic(), text)
+_apps_cache = (None, None, None)
+# An in-place upgrade rewrites values inside an existing entry without touching
+# the root signature, so a cached list is also rescanned once it is this old
+_APPS_CACHE_TTL = 60.0
+
+def _uninstall_signature() -> tuple:
+    """
+    Return (subkey count, last write time) for each Uninstall root, or None for a missing root.
+    
+    Installing or removing an application adds or deletes a subkey, which
+    bumps the root's last write time. Upgrades that only rewrite values in
+    an existing subkey leave it unchanged, which _APPS_CACHE_TTL covers.
+    """
+    signature = []
+    for hkey, subkey_path in _UNINSTALL_KEYS:
+        try:
+            with winreg.OpenKey(hkey, subkey_path) as key:
+                subkey_count, _, last_modified = winreg.QueryInfoKey(key)
+                signature.append((subkey_count, last_modified))
+        except FileNotFoundError:
+            signature.append(None)
+    return tuple(signature)
+
+# Uninstall entry values reported per application, keyed by lowercased
+# value name since registry value names are case-insensitive
+_APP_VALUE_FIELDS = {"displayname": "name", "displayversion": "version", "publisher": "publisher"}
+
+def _read_app_entry(subkey) -> dict:
+    """Collect an Uninstall entry's display fields in one sweep over its values"""
+    fields = {}
+    value_count = winreg.QueryInfoKey(subkey)[1]
+    for i in range(value_count):
+        value_name, value, _ = winreg.EnumValue(subkey, i)
+        field = _APP_VALUE_FIELDS.get(value_name.lower())
+        if field is not None:
+            fields[field] = value
+            if len(fields) == len(_APP_VALUE_FIELDS):
+                break
+    return fields
 
 def register_system_resource_tools(mcp: FastMCP):
     """Register all system resource monitoring related tools"""
     
     @mcp.tool
-    def get_environment_variables() -> str:
+    def get_environment_variables(name: str = "") -> str:
         """List environment variables (or get specific one)"""
         try:
-            env_vars = dict(os.environ)
-            result = "Environment Variables:\n"
-            for key, value in sorted(env_vars.items()):
-                # Truncate very long values for readability
-                display_value = value if len(value) <= 100 else value[:97] + "..."
-                result += f"{key}={display_value}\n"
-            return result
+            if name:
+                value = os.environ.get(name)
+                if value is None:
+                    return f"Environment variable '{name}' is not set"
+                return f"{name}={value}"
+            
+            return "Environment Variables:\n" + ''.join(
+                f"{key}={_truncate_env_value(value)}\n" for key, value in sorted(os.environ.items())
+            )
         except Exception as e:
             return f"Error getting environment variables: {str(e)}"
 
     @mcp.tool
     def get_installed_python_packages() -> str:
         """List installed Python packages"""
+        from importlib.metadata import distributions
         try:
-            packages = []
-            for package in pkg_resources.working_set:
-                packages.append(f"{package.project_name}=={package.version}")
+            # A distribution found on several sys.path entries is listed once, first
+            # match winning, as pkg_resources.working_set did
+            packages = {}
+            for dist in distributions():
+                name = dist.metadata["Name"]
+                if name:
+                    packages.setdefault(name.lower().replace("_", "-"), f"{name}=={dist.version}")
             
             if not packages:
                 return "No packages found"
             
-            packages.sort()
-            return f"Installed Python packages ({len(packages)} total):\n" + "\n".join(packages)
+            return f"Installed Python packages ({len(packages)} total):\n" + "\n".join(sorted(packages.values()))
         except Exception as e:
             return f"Error getting installed packages: {str(e)}"
 
@@ -53,7 +258,7 @@ def register_system_resource_tools(mcp: FastMCP):
     def check_command_exists(command: str) -> str:
         """Check if a command/program is available in PATH"""
         try:
-            result = shutil.which(command)
+            result = _which(command)
             if result:
                 return f"Command '{command}' is available at: {result}"
             else:
@@ -64,11 +269,12 @@ def register_system_resource_tools(mcp: FastMCP):
     @mcp.tool
     def get_system_resources() -> str:
         """Get overall CPU, memory, and disk usage"""
+        import psutil
         try:
             # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
-            cpu_count = psutil.cpu_count()
-            cpu_freq = psutil.cpu_freq()
+            cpu_percent = _cpu_percent()
+            cpu_count = _cpu_counts()[1]
+            cpu_freq = _cpu_freq()
             
             # Memory usage
             memory = psutil.virtual_memory()
@@ -77,37 +283,47 @@ def register_system_resource_tools(mcp: FastMCP):
             # Disk usage
             disk = psutil.disk_usage('/')
             
-            result = f"System Resources:\n\n"
-            result += f"CPU:\n"
-            result += f"  Usage: {cpu_percent}%\n"
-            result += f"  Cores: {cpu_count}\n"
+            parts = [
+                "System Resources:\n\n",
+                "CPU:\n",
+                f"  Usage: {cpu_percent}%\n",
+                f"  Cores: {cpu_count}\n",
+            ]
             if cpu_freq:
-                result += f"  Frequency: {cpu_freq.current:.0f} MHz\n"
-            
-            result += f"\nMemory:\n"
-            result += f"  Total: {_format_size(memory.total)}\n"
-            result += f"  Available: {_format_size(memory.available)}\n"
-            result += f"  Used: {_format_size(memory.used)} ({memory.percent}%)\n"
-            
-            result += f"\nSwap:\n"
-            result += f"  Total: {_format_size(swap.total)}\n"
-            result += f"  Used: {_format_size(swap.used)} ({swap.percent}%)\n"
-            
-            result += f"\nDisk (/):\n"
-            result += f"  Total: {_format_size(disk.total)}\n"
-            result += f"  Used: {_format_size(disk.used)} ({disk.used/disk.total*100:.1f}%)\n"
-            result += f"  Free: {_format_size(disk.free)}\n"
-            
-            return result
+                parts.append(f"  Frequency: {cpu_freq.current:.0f} MHz\n")
+            
+            parts.extend((
+                "\nMemory:\n",
+                f"  Total: {format_size(memory.total)}\n",
+                f"  Available: {format_size(memory.available)}\n",
+                f"  Used: {format_size(memory.used)} ({memory.percent}%)\n",
+                
+                "\nSwap:\n",
+                f"  Total: {format_size(swap.total)}\n",
+                f"  Used: {format_size(swap.used)} ({swap.percent}%)\n",
+                
+                "\nDisk (/):\n",
+                f"  Total: {format_size(disk.total)}\n",
+                f"  Used: {format_size(disk.used)} ({disk.percent}%)\n",
+                f"  Free: {format_size(disk.free)}\n",
+            ))
+            
+            return ''.join(parts)
         except Exception as e:
             return f"Error getting system resources: {str(e)}"
 
     @mcp.tool
     def get_battery_status() -> str:
         """Get battery status information"""
+        import psutil
         try:
+            global _no_battery_at
+            if _recently_absent(_no_battery_at):
+                return "No battery found on this system"
+            
             battery = psutil.sensors_battery()
             if battery is None:
+                _no_battery_at = time.monotonic()
                 return "No battery found on this system"
             
             result = "Battery Status:\n"
@@ -135,9 +351,13 @@ def register_system_resource_tools(mcp: FastMCP):
     def get_windows_version() -> str:
         """Get Windows version and build number"""
         try:
-            if platform.system().lower() != "windows":
+            if not _IS_WINDOWS:
                 return "This function is only available on Windows systems"
             
+            global _windows_version_text
+            if _windows_version_text is not None:
+                return _windows_version_text
+            
             # Get Windows version info
             version_info = platform.version()
             release = platform.release()
@@ -145,7 +365,7 @@ def register_system_resource_tools(mcp: FastMCP):
             result = f"Windows Version Information:\n"
             result += f"  Release: {release}\n"
             result += f"  Version: {version_info}\n"
-            result += f"  Platform: {platform.platform()}\n"
+            result += f"  Platform: {_platform_details()[2]}\n"
             
             # Try to get more detailed build info from registry
             try:
@@ -157,6 +377,9 @@ def register_system_resource_tools(mcp: FastMCP):
                     result += f"  Product Name: {product_name}\n"
                     result += f"  Build Number: {current_build}\n"
                     result += f"  Display Version: {display_version}\n"
+                    
+                    # Only a complete answer is kept; a failed registry read is retried next call
+                    _windows_version_text = result
             except Exception:
                 pass  # Registry access might fail, continue with basic info
             
@@ -167,53 +390,72 @@ def register_system_resource_tools(mcp: FastMCP):
     @mcp.tool
     def get_hardware_information() -> str:
         """Get hardware information"""
+        import psutil
         try:
-            result = "Hardware Information:\n\n"
+            # The probes are independent and spend their time in system calls,
+            # so run them side by side rather than one after another
+            with futures.ThreadPoolExecutor(max_workers=4) as executor:
+                cpu_freq_future = executor.submit(_cpu_freq)
+                memory_future = executor.submit(psutil.virtual_memory)
+                partitions_future = executor.submit(_partition_usages)
+                net_if_stats_future = executor.submit(psutil.net_if_stats)
             
             # CPU Information
-            result += "CPU:\n"
-            result += f"  Processor: {platform.processor()}\n"
-            result += f"  Architecture: {platform.machine()}\n"
-            result += f"  Physical cores: {psutil.cpu_count(logical=False)}\n"
-            result += f"  Total cores: {psutil.cpu_count(logical=True)}\n"
+            processor, machine, _ = _platform_details()
+            physical_cores, logical_cores = _cpu_counts()
+            parts = [
+                "Hardware Information:\n\n",
+                "CPU:\n",
+                f"  Processor: {processor}\n",
+                f"  Architecture: {machine}\n",
+                f"  Physical cores: {physical_cores}\n",
+                f"  Total cores: {logical_cores}\n",
+            ]
             
             # CPU frequencies
-            cpu_freq = psutil.cpu_freq()
+            cpu_freq = cpu_freq_future.result()
             if cpu_freq:
-                result += f"  Current frequency: {cpu_freq.current:.2f} MHz\n"
-                result += f"  Min frequency: {cpu_freq.min:.2f} MHz\n"
-                result += f"  Max frequency: {cpu_freq.max:.2f} MHz\n"
+                parts.extend((
+                    f"  Current frequency: {cpu_freq.current:.2f} MHz\n",
+                    f"  Min frequency: {cpu_freq.min:.2f} MHz\n",
+                    f"  Max frequency: {cpu_freq.max:.2f} MHz\n",
+                ))
             
             # Memory Information
-            memory = psutil.virtual_memory()
-            result += f"\nMemory:\n"
-            result += f"  Total: {_format_size(memory.total)}\n"
-            result += f"  Available: {_format_size(memory.available)}\n"
+            memory = memory_future.result()
+            parts.extend((
+                "\nMemory:\n",
+                f"  Total: {format_size(memory.total)}\n",
+                f"  Available: {format_size(memory.available)}\n",
+            ))
             
             # Disk Information
-            result += f"\nDisk Drives:\n"
-            for partition in psutil.disk_partitions():
-                try:
-                    partition_usage = psutil.disk_usage(partition.mountpoint)
-                    result += f"  {partition.device}\n"
-                    result += f"    Mountpoint: {partition.mountpoint}\n"
-                    result += f"    File system: {partition.fstype}\n"
-                    result += f"    Total Size: {_format_size(partition_usage.total)}\n"
-                    result += f"    Used: {_format_size(partition_usage.used)}\n"
-                    result += f"    Free: {_format_size(partition_usage.free)}\n"
-                except PermissionError:
-                    result += f"  {partition.device}: Permission denied\n"
+            parts.append("\nDisk Drives:\n")
+            for partition, partition_usage, problem in partitions_future.result():
+                if problem:
+                    parts.append(f"  {partition.device}: {problem}\n")
+                else:
+                    parts.extend((
+                        f"  {partition.device}\n",
+                        f"    Mountpoint: {partition.mountpoint}\n",
+                        f"    File system: {partition.fstype}\n",
+                        f"    Total Size: {format_size(partition_usage.total)}\n",
+                        f"    Used: {format_size(partition_usage.used)}\n",
+                        f"    Free: {format_size(partition_usage.free)}\n",
+                    ))
             
             # Network interfaces
-            result += f"\nNetwork Interfaces:\n"
-            net_if_stats = psutil.net_if_stats()
+            parts.append("\nNetwork Interfaces:\n")
+            net_if_stats = net_if_stats_future.result()
             for interface, stats in net_if_stats.items():
-                result += f"  {interface}:\n"
-                result += f"    Up: {'Yes' if stats.isup else 'No'}\n"
-                result += f"    Speed: {stats.speed} Mbps\n"
-                result += f"    MTU: {stats.mtu}\n"
-            
-            return result
+                parts.extend((
+                    f"  {interface}:\n",
+                    f"    Up: {'Yes' if stats.isup else 'No'}\n",
+                    f"    Speed: {stats.speed} Mbps\n",
+                    f"    MTU: {stats.mtu}\n",
+                ))
+            
+            return ''.join(parts)
         except Exception as e:
             return f"Error getting hardware information: {str(e)}"
 
@@ -221,44 +463,46 @@ def register_system_resource_tools(mcp: FastMCP):
     def list_installed_applications() -> str:
         """List installed applications (Windows only)"""
         try:
-            if platform.system().lower() != "windows":
+            if not _IS_WINDOWS:
                 return "This function is currently only available on Windows systems"
             
-            apps = []
+            global _apps_cache
+            signature = _uninstall_signature()
+            if _apps_cache[0] == signature and time.monotonic() - _apps_cache[1] < _APPS_CACHE_TTL:
+                return _apps_cache[2]
             
-            # Check both 32-bit and 64-bit registry locations
-            registry_paths = [
-                (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
-                (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"),
-                (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall")
-            ]
+            # (sort key, output block), one per distinct name and version
+            apps = []
+            seen = set()
             
-            for hkey, subkey_path in registry_paths:
+            for hkey, subkey_path in _UNINSTALL_KEYS:
                 try:
                     with winreg.OpenKey(hkey, subkey_path) as key:
-                        for i in range(0, winreg.QueryInfoKey(key)[0]):
+                        # Enumerate until EnumKey runs out rather than trusting a
+                        # subkey count queried up front
+                        i = 0
+                        while True:
                             try:
                                 subkey_name = winreg.EnumKey(key, i)
+                            except OSError:
+                                break
+                            i += 1
+                            try:
                                 with winreg.OpenKey(key, subkey_name) as subkey:
-                                    try:
-                                        display_name = winreg.QueryValueEx(subkey, "DisplayName")[0]
-                                        try:
-                                            display_version = winreg.QueryValueEx(subkey, "DisplayVersion")[0]
-                                        except FileNotFoundError:
-                                            display_version = "Unknown"
-                                        try:
-                                            publisher = winreg.QueryValueEx(subkey, "Publisher")[0]
-                                        except FileNotFoundError:
-                                            publisher = "Unknown"
-                                        
-                                        apps.append({
-                                            "name": display_name,
-                                            "version": display_version,
-                                            "publisher": publisher
-                                        })
-                                    except FileNotFoundError:
-                                        # Skip entries without DisplayName
-                                        continue
+                                    fields = _read_app_entry(subkey)
+                                
+                                # Skip entries without DisplayName, or with an empty one
+                                name = fields.get("name")
+                                if not name:
+                                    continue
+                                
+                                # Skip duplicates based on name and version
+                                version = fields.get("version", "Unknown")
+                                if (name, version) in seen:
+                                    continue
+                                seen.add((name, version))
+                                publisher = fields.get("publisher", "Unknown")
+                                apps.append((name.lower(), f"Name: {name}\n  Version: {version}\n  Publisher: {publisher}\n\n"))
                             except OSError:
                                 # Skip inaccessible entries
                                 continue
@@ -266,24 +510,12 @@ def register_system_resource_tools(mcp: FastMCP):
                     # Registry key doesn't exist
                     continue
             
-            # Remove duplicates based on name and version
-            unique_apps = []
-            seen = set()
-            for app in apps:
-                key = (app["name"], app["version"])
-                if key not in seen:
-                    seen.add(key)
-                    unique_apps.append(app)
-            
             # Sort by name
-            unique_apps.sort(key=lambda x: x["name"].lower())
+            apps.sort(key=lambda app: app[0])
             
-            result = f"Installed Applications ({len(unique_apps)} found):\n\n"
-            for app in unique_apps:
-                result += f"Name: {app['name']}\n"
-                result += f"  Version: {app['version']}\n"
-                result += f"  Publisher: {app['publisher']}\n\n"
+            result = f"Installed Applications ({len(apps)} found):\n\n" + ''.join(block for _, block in apps)
             
+            _apps_cache = (signature, time.monotonic(), result)
             return result
         except Exception as e:
             return f"Error listing installed applications: {str(e)}"
@@ -291,25 +523,29 @@ def register_system_resource_tools(mcp: FastMCP):
     @mcp.tool
     def get_temperature_information() -> str:
         """Get temperature information from system sensors"""
+        import psutil
         try:
-            temperatures = psutil.sensors_temperatures()
+            global _no_temperatures_at
+            if _recently_absent(_no_temperatures_at):
+                return "No temperature sensors found on this system"
+            
+            # psutil has no sensors_temperatures at all on some platforms, Windows included
+            temperatures = psutil.sensors_temperatures() if hasattr(psutil, "sensors_temperatures") else None
             
             if not temperatures:
+                _no_temperatures_at = time.monotonic()
                 return "No temperature sensors found on this system"
             
-            result = "Temperature Information:\n\n"
+            parts = ["Temperature Information:\n\n"]
             
             for name, entries in temperatures.items():
-                result += f"{name}:\n"
+                parts.append(f"{name}:\n")
                 for entry in entries:
-                    result += f"  {entry.label or 'Unknown'}: {entry.current}°C"
-                    if entry.high:
-                        result += f" (High: {entry.high}°C)"
-                    if entry.critical:
-                        result += f" (Critical: {entry.critical}°C)"
-                    result += "\n"
-                result += "\n"
+                    high = f" (High: {entry.high}°C)" if entry.high else ""
+                    critical = f" (Critical: {entry.critical}°C)" if entry.critical else ""
+                    parts.append(f"  {entry.label or 'Unknown'}: {entry.current}°C{high}{critical}\n")
+                parts.append("\n")
             
-            return result
+            return ''.join(parts)
         except Exception as e:
             return f"Error getting temperature information: {str(e)}"
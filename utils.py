@@ -0,0 +1,63 @@
+import json
+import math
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# (divisor, unit) per bit-length bucket: index 0 covers sizes below 1 KB,
+# and everything from 1 PB up shares the last entry
+_SIZE_UNITS = tuple((1 << (10 * i), unit) for i, unit in enumerate(("B", "KB", "MB", "GB", "TB", "PB")))
+_LAST_SIZE_UNIT = len(_SIZE_UNITS) - 1
+
+def format_size(size_bytes: int) -> str:
+    """Convert bytes to human-readable format"""
+    # Each unit is 2**10 of the previous one, so the bit length picks it directly
+    size_bytes = int(size_bytes)
+    divisor, unit = _SIZE_UNITS[min(max(size_bytes.bit_length() - 1, 0) // 10, _LAST_SIZE_UNIT)]
+    return f"{size_bytes / divisor:.1f} {unit}"
+
+# Last second formatted by _local_parts, as (second, date text, time text); directory
+# listings often hold runs of entries with the same mtime second
+_last_second = (None, "", "")
+
+def _local_parts(second: int):
+    """Return ("YYYY-MM-DD", "HH:MM:SS") for a whole POSIX second in local time"""
+    global _last_second
+    cached = _last_second
+    if cached[0] == second:
+        return cached[1], cached[2]
+    
+    t = time.localtime(second)
+    date = f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+    clock = f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+    _last_second = (second, date, clock)
+    return date, clock
+
+def _split_timestamp(timestamp: float):
+    """Split a POSIX timestamp into (second, microsecond), rounding like datetime.fromtimestamp"""
+    second = math.floor(timestamp)
+    micro = round((timestamp - second) * 1e6)
+    if micro == 1000000:
+        return second + 1, 0
+    return second, micro
+
+def format_timestamp(timestamp: float) -> str:
+    """Format a POSIX timestamp as local 'YYYY-MM-DD HH:MM:SS' without building a datetime"""
+    date, clock = _local_parts(_split_timestamp(timestamp)[0])
+    return f"{date} {clock}"
+
+def isoformat_timestamp(timestamp: float) -> str:
+    """Format a POSIX timestamp like datetime.fromtimestamp(timestamp).isoformat()"""
+    second, micro = _split_timestamp(timestamp)
+    date, clock = _local_parts(second)
+    return f"{date}T{clock}.{micro:06d}" if micro else f"{date}T{clock}"
+
+def dumps_indented(data) -> str:
+    """Serialize data as 2-space indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    # Keep the fallback's output identical to orjson, which never escapes non-ASCII
+    return json.dumps(data, indent=2, ensure_ascii=False)